@@ -0,0 +1,48 @@
+"""
+Tests for the chat route's in-memory session store
+"""
+
+import pytest
+from thalos_prime.api.routes import chat
+
+
+@pytest.fixture(autouse=True)
+def small_store(monkeypatch: pytest.MonkeyPatch):
+    """Run each test against an empty store capped at three sessions"""
+    monkeypatch.setattr(chat, 'SESSION_MAX_ENTRIES', 3)
+    saved = chat.SESSIONS.copy()
+    chat.SESSIONS.clear()
+    yield
+    chat.SESSIONS.clear()
+    chat.SESSIONS.update(saved)
+
+
+def test_session_store_evicts_least_recently_used() -> None:
+    """Test that filling past the cap evicts the least recently used session"""
+    first = chat.get_or_create_session()
+    second = chat.get_or_create_session()
+    third = chat.get_or_create_session()
+    
+    # Touching the oldest session moves it to the most-recent end
+    assert chat.get_or_create_session(first) == first
+    assert list(chat.SESSIONS) == [second, third, first]
+    
+    fourth = chat.get_or_create_session()
+    
+    assert len(chat.SESSIONS) == 3
+    assert second not in chat.SESSIONS
+    assert list(chat.SESSIONS) == [third, first, fourth]
+
+
+def test_expired_session_is_replaced(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that an expired session id gets a new session and is dropped"""
+    clock = [1_000_000.0]
+    monkeypatch.setattr(chat.time, 'time', lambda: clock[0])
+    
+    stale = chat.get_or_create_session()
+    clock[0] += chat.SESSION_TTL + 1
+    
+    fresh = chat.get_or_create_session(stale)
+    
+    assert fresh != stale
+    assert list(chat.SESSIONS) == [fresh]
@@ -0,0 +1,20 @@
+"""
+Tests for the API configuration
+"""
+
+import pytest
+from thalos_prime.api.config import APIConfig, load_config
+
+
+def test_worker_default_matches_env_loader(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that APIConfig() and load_config() agree on the worker count"""
+    monkeypatch.delenv('THALOS_WORKERS', raising=False)
+    
+    assert APIConfig().workers == load_config().workers == 1
+
+
+def test_worker_count_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that THALOS_WORKERS overrides the default"""
+    monkeypatch.setenv('THALOS_WORKERS', '3')
+    
+    assert load_config().workers == 3
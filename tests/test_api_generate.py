@@ -0,0 +1,23 @@
+"""
+Tests for the generate route helpers
+"""
+
+from thalos_prime.api.routes import generate
+from thalos_prime.lob_babel_generator import BabelGenerator, text_to_address
+
+
+def test_query_to_address_caches_page_sized_queries() -> None:
+    """Test that short queries are memoized and map to the same address"""
+    generate._cached_text_to_address.cache_clear()
+    
+    assert generate._query_to_address("hello world") == text_to_address("hello world")
+    assert generate._cached_text_to_address.cache_info().currsize == 1
+
+
+def test_query_to_address_skips_cache_for_oversized_query() -> None:
+    """Test that a query longer than a page is not retained"""
+    generate._cached_text_to_address.cache_clear()
+    query = "x" * (BabelGenerator.PAGE_LENGTH + 1)
+    
+    assert generate._query_to_address(query) == text_to_address(query)
+    assert generate._cached_text_to_address.cache_info().currsize == 0
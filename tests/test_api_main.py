@@ -0,0 +1,56 @@
+"""
+Tests for the landing page route helpers
+"""
+
+import pytest
+from thalos_prime.api.routes.main import INDEX_HEADERS, _accepts_gzip
+
+
+@pytest.mark.parametrize("header,expected", [
+    ("gzip", True),
+    ("gzip, deflate, br", True),
+    ("GZIP;q=0.5", True),
+    ("x-gzip", True),
+    ("*", True),
+    ("", False),
+    ("identity", False),
+    ("br", False),
+    ("gzip;q=0", False),
+    ("gzip; q=0.000, br", False),
+    ("gzip;q=0, *", False),
+    ("*;q=0", False),
+    ("gzip;q=1, *;q=0", True),
+    ("gzip;q=abc", False),
+])
+def test_accepts_gzip(header: str, expected: bool) -> None:
+    """Test Accept-Encoding negotiation including q-values"""
+    assert _accepts_gzip(header) is expected
+
+
+def test_index_headers_vary_on_encoding() -> None:
+    """Test that every landing page response varies on Accept-Encoding"""
+    assert INDEX_HEADERS['Vary'] == 'Accept-Encoding'
+    assert 'ETag' in INDEX_HEADERS
+
+
+def test_root_honours_gzip_refusal() -> None:
+    """Test that gzip;q=0 gets an uncompressed page with Vary set once"""
+    from fastapi.testclient import TestClient
+    from thalos_prime.api.server import app
+    
+    client = TestClient(app)
+    refused = client.get("/", headers={"Accept-Encoding": "gzip;q=0"})
+    accepted = client.get("/", headers={"Accept-Encoding": "gzip"})
+    
+    plain = client.get("/", headers={"Accept-Encoding": ""})
+    
+    assert "content-encoding" not in refused.headers
+    assert "content-encoding" not in plain.headers
+    assert accepted.headers["content-encoding"] == "gzip"
+    for response in (refused, plain, accepted):
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] == INDEX_HEADERS['ETag']
+    
+    revalidated = client.get("/", headers={"If-None-Match": INDEX_HEADERS['ETag']})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["vary"] == "Accept-Encoding"
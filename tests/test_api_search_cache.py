@@ -0,0 +1,67 @@
+"""
+Tests for the search route's in-memory result cache
+"""
+
+import pytest
+from thalos_prime.api.routes import search
+
+
+def _recomputed_totals() -> dict[str, int]:
+    """Recompute the running totals from the cache contents"""
+    return {
+        'bytes': sum(len(data['results_json']) for data, _ in search.SEARCH_CACHE.values()),
+        'timestamp_ns_sum': sum(search._timestamp_ns(timestamp) for _, timestamp in search.SEARCH_CACHE.values())
+    }
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Run each test against an empty cache"""
+    search.clear_cache()
+    yield
+    search.clear_cache()
+
+
+def test_cache_totals_match_contents(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the running totals through insert, overwrite, LRU evict and TTL expiry"""
+    monkeypatch.setattr(search, 'CACHE_MAX_ENTRIES', 3)
+    clock = [1_800_000_000.123456]
+    monkeypatch.setattr(search.time, 'time', lambda: clock[0])
+    
+    def insert(key: str, size: int) -> None:
+        clock[0] += 0.1
+        search.cache_search(key, {'results_json': b'x' * size, 'total_found': 0})
+        assert search._CACHE_TOTALS == _recomputed_totals()
+    
+    insert('a', 10)
+    insert('b', 20)
+    insert('a', 30)  # Overwrite
+    insert('c', 40)
+    insert('d', 50)  # Evicts 'b', the least recently used
+    assert list(search.SEARCH_CACHE) == ['a', 'c', 'd']
+    
+    # Expire everything through lookups
+    clock[0] += search.CACHE_TTL + 1
+    for key in ['a', 'c', 'd']:
+        assert search.get_cached_search(key) is None
+        assert search._CACHE_TOTALS == _recomputed_totals()
+    
+    assert not search.SEARCH_CACHE
+    assert search._CACHE_TOTALS == {'bytes': 0, 'timestamp_ns_sum': 0}
+
+
+def test_cache_totals_do_not_drift(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that heavy churn leaves no residue once the cache empties"""
+    monkeypatch.setattr(search, 'CACHE_MAX_ENTRIES', 7)
+    clock = [1_800_000_000.0]
+    monkeypatch.setattr(search.time, 'time', lambda: clock[0])
+    
+    for i in range(5000):
+        clock[0] += 0.000123
+        search.cache_search(f'key{i % 13}', {'results_json': b'x', 'total_found': 0})
+    assert search._CACHE_TOTALS == _recomputed_totals()
+    
+    clock[0] += search.CACHE_TTL + 1
+    for key in list(search.SEARCH_CACHE):
+        search.get_cached_search(key)
+    assert search._CACHE_TOTALS == {'bytes': 0, 'timestamp_ns_sum': 0}
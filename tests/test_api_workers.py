@@ -0,0 +1,90 @@
+"""
+Tests for the shared worker pool helpers
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from thalos_prime.api import workers
+from thalos_prime.api.workers import MIN_CHUNK_SIZE, chunk_evenly, map_chunks
+
+
+def _tag_chunk(items: list[int], offset: int) -> tuple[str, list[int]]:
+    """Return the running thread's name with the shifted items"""
+    return threading.current_thread().name, [item + offset for item in items]
+
+
+def test_chunk_evenly_empty() -> None:
+    """Test that empty input yields no slices"""
+    assert chunk_evenly([], 4) == []
+    assert chunk_evenly([], 4, min_size=16) == []
+
+
+def test_chunk_evenly_near_equal_and_ordered() -> None:
+    """Test slice sizes differ by at most one and preserve order"""
+    items = list(range(10))
+    chunks = chunk_evenly(items, 4)
+    
+    assert [len(chunk) for chunk in chunks] == [3, 3, 2, 2]
+    assert [item for chunk in chunks for item in chunk] == items
+    assert chunk_evenly(items[:2], 4) == [[0], [1]]
+
+
+def test_chunk_evenly_min_size() -> None:
+    """Test that min_size limits the number of slices"""
+    items = list(range(20))
+    
+    assert chunk_evenly(items, 4, min_size=16) == [items]
+    assert chunk_evenly(items, 4, min_size=8) == [items[:10], items[10:]]
+    assert chunk_evenly(items[:3], 4, min_size=16) == [items[:3]]
+
+
+@pytest.fixture
+def fake_pool(monkeypatch: pytest.MonkeyPatch):
+    """Stand a thread pool in for the process pool, with four 'cores'"""
+    pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="fake-pool")
+    monkeypatch.setattr(workers, '_CPU_POOL', pool)
+    monkeypatch.setattr(workers, 'cpu_count', lambda: 4)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+def test_map_chunks_without_pool_runs_in_thread(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that calls before the pool is started stay in-process"""
+    monkeypatch.setattr(workers, '_CPU_POOL', None)
+    monkeypatch.setattr(workers, 'cpu_count', lambda: 4)
+    items = list(range(4 * MIN_CHUNK_SIZE))
+    
+    results = asyncio.run(map_chunks(_tag_chunk, items, 1))
+    
+    assert all(not name.startswith("fake-pool") for name, _ in results)
+    assert [item for _, chunk in results for item in chunk] == [item + 1 for item in items]
+
+
+def test_map_chunks_single_chunk_skips_pool(fake_pool: ThreadPoolExecutor) -> None:
+    """Test that a batch smaller than two slices does not use the pool"""
+    items = list(range(2 * MIN_CHUNK_SIZE - 1))
+    
+    results = asyncio.run(map_chunks(_tag_chunk, items, 0))
+    
+    assert len(results) == 1
+    assert not results[0][0].startswith("fake-pool")
+    assert results[0][1] == items
+
+
+def test_map_chunks_uses_pool_and_keeps_order(fake_pool: ThreadPoolExecutor) -> None:
+    """Test that large batches fan out to the pool and return in order"""
+    items = list(range(4 * MIN_CHUNK_SIZE + 3))
+    
+    results = asyncio.run(map_chunks(_tag_chunk, items, 0))
+    
+    assert len(results) == 4
+    assert all(name.startswith("fake-pool") for name, _ in results)
+    assert [item for _, chunk in results for item in chunk] == items
+
+
+def test_map_chunks_empty(fake_pool: ThreadPoolExecutor) -> None:
+    """Test that no items means no calls"""
+    assert asyncio.run(map_chunks(_tag_chunk, [], 0)) == []
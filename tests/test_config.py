@@ -92,3 +92,14 @@ def test_library_config_added_to_path_flag() -> None:
     # After changing path, flag should reset
     config.set_local_library_path("new_path")
     assert config._added_to_path is False
+
+
+def test_set_same_path_keeps_added_flag(tmp_path: Path) -> None:
+    """Test that re-setting the current path doesn't force a new setup"""
+    config = LibraryConfig(local_library_path=str(tmp_path))
+    assert config.setup_imports() is True
+    assert config._added_to_path is True
+    
+    # Re-setting the same path should keep the registration
+    config.set_local_library_path(str(tmp_path))
+    assert config._added_to_path is True
@@ -3,12 +3,14 @@ Tests for the Babel decoder module
 """
 
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from thalos_prime.lob_decoder import (
     BabelDecoder,
     CoherenceScore,
     DecodedPage,
     score_coherence,
-    decode_page
+    decode_page,
+    decode_pages
 )
 
 
@@ -132,6 +134,20 @@ def test_score_ngrams() -> None:
     assert score > 0.0
 
 
+def test_score_ngrams_counts_bigrams_with_a_common_word() -> None:
+    """Test that a bigram is coherent when either of its words is common"""
+    decoder = BabelDecoder()
+    
+    # Bigrams: (the, xx) (xx, yy) (yy, the) (the, zz) -> 3 of 4 coherent
+    assert decoder._score_ngrams("the xx yy the zz") == pytest.approx(0.75 * 0.6)
+    
+    # Leading run of uncommon words: (xx, yy) (yy, the) -> 1 of 2 coherent
+    assert decoder._score_ngrams("xx yy the") == pytest.approx(0.5 * 0.6)
+    
+    # No common words at all
+    assert decoder._score_ngrams("xx yy zz") == 0.0
+
+
 def test_score_exact_match_full() -> None:
     """Test exact match with full query match"""
     decoder = BabelDecoder()
@@ -305,6 +321,29 @@ def test_convenience_function_decode_page() -> None:
     assert decoded.address == address
 
 
+def test_decode_pages_matches_decode_page() -> None:
+    """Test that batch decoding matches per-page decoding in order"""
+    decoder = BabelDecoder()
+    
+    addresses = ["batch1", "batch2", "batch3"]
+    texts = ["the cat sat.", "xqz vvk", "it is the way"]
+    
+    decoded = decoder.decode_pages(addresses, texts, query="the cat", source='remote')
+    
+    assert [d.address for d in decoded] == addresses
+    for page, text in zip(decoded, texts):
+        single = decoder.decode_page(page.address, text, query="the cat", source='remote')
+        assert page.raw_text == text
+        assert page.source == 'remote'
+        assert page.coherence == single.coherence
+
+
+def test_decode_pages_length_mismatch() -> None:
+    """Test that mismatched addresses and texts are rejected"""
+    with pytest.raises(ValueError):
+        decode_pages(["a", "b"], ["only one"])
+
+
 def test_enable_llm() -> None:
     """Test enabling LLM normalization"""
     decoder = BabelDecoder()
@@ -345,3 +384,83 @@ def test_different_queries_different_scores() -> None:
     # "elephant" should score lowest (not in text)
     assert score3.exact_match_score < score1.exact_match_score
     assert score3.exact_match_score < score2.exact_match_score
+
+
+def test_score_coherence_is_cached_per_text_and_query() -> None:
+    """Test that repeated scoring returns the cached result"""
+    decoder = BabelDecoder()
+    text = "the cat sat on the mat."
+    
+    first = decoder.score_coherence(text, "cat")
+    assert decoder.score_coherence(text, "cat") == first
+    assert len(decoder._score_cache) == 1
+    decoder.score_coherence(text, "dog")
+    assert len(decoder._score_cache) == 2
+    
+    decoder.clear_score_cache()
+    assert not decoder._score_cache
+    again = decoder.score_coherence(text, "cat")
+    assert again == first
+
+
+def test_cached_score_metrics_are_not_shared() -> None:
+    """Test that mutating a returned score's metrics leaves the cache intact"""
+    decoder = BabelDecoder()
+    text = "the cat sat on the mat."
+    
+    first = decoder.score_coherence(text, "cat")
+    expected = dict(first.metrics)
+    first.metrics['word_count'] = -1
+    
+    second = decoder.score_coherence(text, "cat")
+    assert second.metrics == expected
+    second.metrics.clear()
+    assert decoder.score_coherence(text, "cat").metrics == expected
+
+
+def test_large_decode_text_is_not_cached() -> None:
+    """Test that user-supplied text longer than a page is not retained"""
+    from thalos_prime import lob_decoder
+    
+    text = "the cat sat on the mat. " * 1000
+    decode_page(address="abc123", text=text)
+    decode_page(address="abc123", text="the cat sat.", query=text)
+    
+    assert all(
+        len(cached_text) <= BabelDecoder.CACHEABLE_TEXT_LENGTH
+        and (query is None or len(query) <= BabelDecoder.CACHEABLE_TEXT_LENGTH)
+        for cached_text, query in lob_decoder._decoder._score_cache
+    )
+
+
+def test_score_coherence_concurrent_threads() -> None:
+    """Test that threads sharing one decoder and a churning cache agree"""
+    decoder = BabelDecoder()
+    decoder.SCORE_CACHE_SIZE = 4  # Force constant eviction
+    texts = [f"the page number {i} of the library." for i in range(32)]
+    expected = [BabelDecoder().score_coherence(text, "page") for text in texts]
+    
+    def score_all(_: int) -> list[CoherenceScore]:
+        return [decoder.score_coherence(text, "page") for text in texts]
+    
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for scores in pool.map(score_all, range(32)):
+            assert scores == expected
+
+
+def test_decode_page_timestamps_agree() -> None:
+    """Test that the page and its provenance record share one timestamp"""
+    decoded = decode_page(address="abc123", text="the cat sat.")
+    
+    assert decoded.provenance['timestamp'] == decoded.timestamp
+
+
+def test_long_query_terms_are_not_cached() -> None:
+    """Test that queries beyond the cache limit are split but not memoized"""
+    from thalos_prime import lob_decoder
+    
+    query = "needle " * lob_decoder.QUERY_CACHE_MAX_LENGTH
+    before = lob_decoder._cached_query_terms.cache_info().currsize
+    
+    assert lob_decoder._query_terms(query) == (query, frozenset({'needle'}))
+    assert lob_decoder._cached_query_terms.cache_info().currsize == before
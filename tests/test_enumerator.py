@@ -2,6 +2,7 @@
 Tests for the Babel enumerator module
 """
 
+import hashlib
 import pytest
 from thalos_prime.lob_babel_enumerator import (
     BabelEnumerator,
@@ -199,6 +200,18 @@ def test_enumerate_substrings_short_text() -> None:
     assert len(results) == 0
 
 
+def test_iter_substrings_matches_enumerate_substrings() -> None:
+    """Test that lazy substring iteration yields the same pairs"""
+    enum = BabelEnumerator()
+    
+    text = "Hello World  testing"
+    
+    lazy = enum.iter_substrings(text, substring_length=4)
+    
+    assert not isinstance(lazy, list)
+    assert list(lazy) == enum.enumerate_substrings(text, substring_length=4)
+
+
 def test_find_common_addresses() -> None:
     """Test finding common addresses between two queries"""
     enum = BabelEnumerator()
@@ -283,3 +296,41 @@ def test_results_sorted_by_score() -> None:
             current_score: float = results[i]['score']
             next_score: float = results[i + 1]['score']
             assert current_score >= next_score
+
+
+def test_ngram_address_is_sha256_of_seed() -> None:
+    """Test that addresses are the SHA-256 of '<ngram>:<offset>'"""
+    enum = BabelEnumerator()
+    
+    for ngram, offset in [("hello", 0), ("wörld", 3)]:
+        expected = hashlib.sha256(f"{ngram}:{offset}".encode('utf-8')).hexdigest()
+        assert enum._ngram_to_address(ngram, offset=offset) == expected
+    
+    # The inlined substring path must agree with _ngram_to_address
+    for substring, address in enum.iter_substrings("hello world", substring_length=4):
+        assert address == enum._ngram_to_address(substring, offset=0)
+
+
+def test_extract_ngrams_order_longer_first_then_alphabetical() -> None:
+    """Test that n-grams come longest first, ties broken alphabetically"""
+    enum = BabelEnumerator()
+    
+    ngrams = enum._extract_ngrams("zebra extraordinarily ab")
+    
+    assert ngrams == sorted(set(ngrams), key=lambda x: (-len(x), x))
+    assert ngrams[0] == "extraordinarily"
+
+
+def test_addresses_only_matches_enumerate_addresses() -> None:
+    """Test that the lean address set equals the full depth-1 enumeration"""
+    enum = BabelEnumerator()
+    
+    for query in ["hello world", "the quick brown fox jumps", "a", "  "]:
+        expected = {item['address'] for item in enum.enumerate_addresses(query, max_results=50)}
+        assert enum._addresses_only(query) == expected
+        
+        # A smaller max_results keeps the best-scored subset of that set
+        for max_results in (1, 3, 9):
+            ranked = enum.enumerate_addresses(query, max_results=max_results)
+            assert len(ranked) <= max_results
+            assert {item['address'] for item in ranked} <= expected
@@ -2,6 +2,7 @@
 Tests for the Babel generator module
 """
 
+import hashlib
 import pytest
 from thalos_prime.lob_babel_generator import (
     BabelGenerator,
@@ -111,6 +112,15 @@ def test_normalize_text_lowercase() -> None:
     assert "hello" in normalized
 
 
+def test_normalize_text_non_ascii_characters() -> None:
+    """Test that each non-ASCII character becomes exactly one space"""
+    gen = BabelGenerator()
+    
+    normalized = gen._normalize_text("café, naïve.")
+    assert normalized.startswith("caf , na ve.")
+    assert len(normalized) == 3200
+
+
 def test_normalize_text_invalid_characters() -> None:
     """Test that invalid characters are replaced with space"""
     gen = BabelGenerator()
@@ -240,3 +250,25 @@ def test_roundtrip_consistency() -> None:
     page1 = gen.address_to_page(address)
     page2 = gen.address_to_page(address)
     assert page1 == page2
+
+
+def test_address_to_page_matches_per_position_hash() -> None:
+    """Test that page generation matches hashing seed + position directly"""
+    gen = BabelGenerator()
+    address = "abc123"
+    
+    page = gen.address_to_page(address)
+    
+    for position in (0, 1, 10, 999, 3199):
+        digest = hashlib.sha256((address + str(position)).encode('utf-8')).digest()
+        expected = gen.CHARSET[int.from_bytes(digest[:4], byteorder='big') % gen.CHARSET_SIZE]
+        assert page[position] == expected
+
+
+def test_address_to_pages_matches_address_to_page() -> None:
+    """Test that batch generation matches generating each page alone"""
+    gen = BabelGenerator()
+    addresses = ["abc123", " ABC123 ", "f" * 100, ""]
+    
+    assert gen.address_to_pages(addresses) == [gen.address_to_page(a) for a in addresses]
+    assert gen.address_to_pages([]) == []
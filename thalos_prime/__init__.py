@@ -63,7 +63,8 @@ from thalos_prime.lob_decoder import (
     CoherenceScore,
     DecodedPage,
     score_coherence,
-    decode_page
+    decode_page,
+    decode_pages
 )
 
 __all__ = [
@@ -95,6 +96,7 @@ __all__ = [
     'DecodedPage',
     'score_coherence',
     'decode_page',
+    'decode_pages',
     
     # Synthesis
     'deep_synthesis',
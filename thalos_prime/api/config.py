@@ -15,7 +15,7 @@ class APIConfig(BaseModel):
     # Server settings
     host: str = Field(default="0.0.0.0", description="Server host")
     port: int = Field(default=8000, description="Server port")
-    workers: int = Field(default=4, description="Number of worker processes")
+    workers: int = Field(default=1, description="Number of worker processes")
     reload: bool = Field(default=False, description="Enable auto-reload")
     
     # Database settings
@@ -72,8 +72,8 @@ class APIConfig(BaseModel):
     
     # CORS
     cors_origins: list[str] = Field(
-        default_factory=lambda: ["*"],
-        description="Allowed CORS origins"
+        default_factory=list,
+        description="Allowed CORS origins (empty disables CORS; the UI is same-origin)"
     )
     
     class Config:
@@ -87,6 +87,7 @@ def load_config() -> APIConfig:
     return APIConfig(
         host=os.getenv("THALOS_HOST", "0.0.0.0"),
         port=int(os.getenv("THALOS_PORT", "8000")),
+        workers=int(os.getenv("THALOS_WORKERS", "1")),
         database_url=os.getenv("THALOS_DATABASE_URL", "sqlite:///./thalos_prime.db"),
         redis_url=os.getenv("THALOS_REDIS_URL", "redis://localhost:6379/0"),
         cache_ttl=int(os.getenv("THALOS_CACHE_TTL", "3600")),
@@ -94,6 +95,11 @@ def load_config() -> APIConfig:
         llm_provider=os.getenv("THALOS_LLM_PROVIDER", "openai"),
         llm_api_key=os.getenv("THALOS_LLM_API_KEY"),
         secret_key=os.getenv("THALOS_SECRET_KEY", "change-this-secret-key-in-production"),
+        cors_origins=[
+            origin.strip()
+            for origin in os.getenv("THALOS_CORS_ORIGINS", "").split(",")
+            if origin.strip()
+        ],
     )
 
 
@@ -0,0 +1,68 @@
+"""
+API Response Classes
+
+Custom response classes for the Thalos Prime API.
+"""
+
+import dataclasses
+import json
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+def _default(obj: Any) -> Any:
+    """json.dumps fallback hook for the types orjson encodes natively"""
+    if isinstance(obj, datetime):
+        # Same form as orjson with OPT_UTC_Z
+        text = obj.isoformat()
+        if obj.utcoffset() == timezone.utc.utcoffset(None):
+            text = text[:-6] + "Z"
+        return text
+    if isinstance(obj, Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize content to compact JSON bytes.
+
+    Uses orjson when installed, otherwise matches JSONResponse's encoding.
+    Dataclass instances (e.g. decoder results), datetimes (ISO 8601, UTC as
+    "Z") and enums are encoded in both cases; orjson handles them natively
+    without an intermediate dict.
+    """
+    if orjson is None:
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+            default=_default,
+        ).encode("utf-8")
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response serialized with orjson when it is installed.
+
+    orjson writes UTF-8 bytes directly and is several times faster than the
+    stdlib encoder on large payloads. Without orjson this behaves exactly
+    like JSONResponse.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Serialize content to JSON bytes"""
+        return dumps(content)
@@ -5,19 +5,125 @@ Provides administrative and monitoring functionality.
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Header
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
+import asyncio
+import functools
 import time
 import sys
-import psutil
 import os
 
+if TYPE_CHECKING:
+    import psutil
+
 from thalos_prime import __version__
+from thalos_prime.api.responses import FastJSONResponse
 
 router = APIRouter()
 
 # Simple API key authentication (replace with proper auth in production)
 ADMIN_API_KEY = os.getenv("THALOS_ADMIN_API_KEY", "admin-key-change-in-production")
 
+# Cached handle for the current process; psutil is imported on first use so
+# workers that never serve /status don't pay for it at startup
+_PROCESS: Optional["psutil.Process"] = None
+_CPU_COUNT: Optional[int] = None  # Fixed for the life of the process
+
+
+def _get_process() -> "psutil.Process":
+    """Return the cached psutil handle for this process, creating it once"""
+    global _PROCESS, _CPU_COUNT
+    
+    if _PROCESS is None:
+        import psutil
+        _CPU_COUNT = psutil.cpu_count()
+        _PROCESS = psutil.Process()
+        # Prime the CPU counter so the first non-blocking sample is meaningful
+        _PROCESS.cpu_percent(interval=None)
+    
+    return _PROCESS
+
+
+# Latest CPU sample, refreshed by a background task so /status never samples
+CPU_SAMPLE_INTERVAL = 1.0  # seconds
+_CPU_STATE: dict[str, Optional[float]] = {'cpu_percent': None, 'sampled_at': None}
+_CPU_SAMPLER: Optional["asyncio.Task[None]"] = None
+
+
+async def _sample_cpu() -> None:
+    """Refresh the cached process CPU percentage until cancelled"""
+    process = _get_process()
+    while True:
+        _CPU_STATE['cpu_percent'] = process.cpu_percent(interval=None)
+        _CPU_STATE['sampled_at'] = time.time()
+        await asyncio.sleep(CPU_SAMPLE_INTERVAL)
+
+
+def start_cpu_sampler() -> None:
+    """Start the background CPU sampler on the running loop if needed"""
+    global _CPU_SAMPLER
+    
+    loop = asyncio.get_running_loop()
+    if _CPU_SAMPLER is None or _CPU_SAMPLER.done() or _CPU_SAMPLER.get_loop() is not loop:
+        _CPU_SAMPLER = loop.create_task(_sample_cpu())
+
+
+async def stop_cpu_sampler() -> None:
+    """Cancel the background CPU sampler, if running"""
+    global _CPU_SAMPLER
+    
+    task, _CPU_SAMPLER = _CPU_SAMPLER, None
+    if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+        return
+    
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+# Short-lived response cache for polled admin endpoints: key -> (expires_at, body)
+_RESPONSE_CACHE: dict[str, tuple[float, dict[str, Any]]] = {}
+RESPONSE_CACHE_TTL = 5.0  # seconds
+
+AdminHandler = Callable[[], Awaitable[dict[str, Any]]]
+
+
+def ttl_cache(seconds: float = RESPONSE_CACHE_TTL) -> Callable[[AdminHandler], AdminHandler]:
+    """
+    Cache an admin handler's response body for a few seconds.
+    
+    Repeated dashboard polls within the TTL are answered from memory
+    instead of recomputing process/system snapshots.
+    
+    Args:
+        seconds: Time-to-live for cached responses
+    
+    Returns:
+        Decorator for zero-argument async handlers
+    """
+    def decorator(func: AdminHandler) -> AdminHandler:
+        key = func.__name__
+        
+        @functools.wraps(func)
+        async def wrapper() -> dict[str, Any]:
+            now = time.monotonic()
+            cached = _RESPONSE_CACHE.get(key)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+            body = await func()
+            _RESPONSE_CACHE[key] = (now + seconds, body)
+            return body
+        
+        return wrapper
+    
+    return decorator
+
+
+def invalidate_response_cache() -> None:
+    """Drop all cached admin responses"""
+    _RESPONSE_CACHE.clear()
+
 
 def verify_admin_key(x_api_key: Optional[str] = Header(None)) -> bool:
     """Verify admin API key"""
@@ -27,6 +133,7 @@ def verify_admin_key(x_api_key: Optional[str] = Header(None)) -> bool:
 
 
 @router.get("/status", dependencies=[Depends(verify_admin_key)])
+@ttl_cache()
 async def get_system_status() -> dict[str, Any]:
     """
     Get comprehensive system status.
@@ -37,17 +144,27 @@ async def get_system_status() -> dict[str, Any]:
         System status and metrics
     """
     try:
-        # Get process info
-        process = psutil.Process()
-        
-        # Memory info
-        memory_info = process.memory_info()
-        memory_percent = process.memory_percent()
+        import psutil
         
-        # CPU info
-        cpu_percent = process.cpu_percent(interval=0.1)
+        # Get process info; CPU usage comes from the background sampler,
+        # which is started lazily by the first status request
+        process = _get_process()
+        start_cpu_sampler()
+        cpu_percent = _CPU_STATE['cpu_percent']
         
-        # System info
+        # Batch the /proc reads for all per-process metrics
+        with process.oneshot():
+            # Memory info
+            memory_info = process.memory_info()
+            memory_percent = process.memory_percent()
+
+            # CPU info (non-blocking fallback until the first sample lands)
+            if cpu_percent is None:
+                cpu_percent = process.cpu_percent(interval=None)
+
+            num_threads = process.num_threads()
+
+        # System info (one live read; the CPU count is cached with the process)
         system_memory = psutil.virtual_memory()
         
         return {
@@ -59,20 +176,25 @@ async def get_system_status() -> dict[str, Any]:
                 'cpu_percent': cpu_percent,
                 'memory_mb': memory_info.rss / 1024 / 1024,
                 'memory_percent': memory_percent,
-                'threads': process.num_threads()
+                'threads': num_threads
             },
             'system': {
                 'total_memory_mb': system_memory.total / 1024 / 1024,
                 'available_memory_mb': system_memory.available / 1024 / 1024,
                 'memory_percent': system_memory.percent,
-                'cpu_count': psutil.cpu_count()
+                'cpu_count': _CPU_COUNT
             }
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Status check failed: {str(e)}")
 
 
-@router.get("/metrics", dependencies=[Depends(verify_admin_key)])
+@router.get(
+    "/metrics",
+    dependencies=[Depends(verify_admin_key)],
+    response_class=FastJSONResponse
+)
+@ttl_cache()
 async def get_metrics() -> dict[str, Any]:
     """
     Get application metrics.
@@ -86,11 +208,19 @@ async def get_metrics() -> dict[str, Any]:
     from thalos_prime.api.routes.chat import SESSIONS
     from thalos_prime.api.routes.search import SEARCH_CACHE
     
+    # SESSIONS is ordered by last_activity, so count back from the newest
+    # entry and stop at the first inactive one
+    current_time = time.time()
+    active = 0
+    for session in reversed(SESSIONS.values()):
+        if current_time - session['last_activity'] >= 3600:
+            break
+        active += 1
+    
     return {
         'sessions': {
             'total': len(SESSIONS),
-            'active': sum(1 for s in SESSIONS.values() 
-                         if time.time() - s['last_activity'] < 3600)
+            'active': active
         },
         'cache': {
             'search_entries': len(SEARCH_CACHE)
@@ -109,10 +239,14 @@ async def clear_all_caches() -> dict[str, Any]:
     Returns:
         Cache clear status
     """
-    from thalos_prime.api.routes.search import SEARCH_CACHE
+    from thalos_prime.api.routes.search import clear_cache
+    from thalos_prime.lob_decoder import clear_score_cache
     
-    search_count = len(SEARCH_CACHE)
-    SEARCH_CACHE.clear()
+    search_count = clear_cache()
+    invalidate_response_cache()
+    # Only the module-level decoder in lob_decoder fills a score cache;
+    # worker processes keep their own and are not reached from here
+    clear_score_cache()
     
     return {
         'message': 'All caches cleared',
@@ -135,26 +269,28 @@ async def cleanup_sessions(max_age_hours: int = 24) -> dict[str, Any]:
     """
     from thalos_prime.api.routes.chat import SESSIONS
     
-    current_time = time.time()
-    max_age_seconds = max_age_hours * 3600
+    cutoff = time.time() - max_age_hours * 3600
     
-    # Find and remove old sessions
-    old_sessions = [
-        sid for sid, session in SESSIONS.items()
-        if current_time - session['last_activity'] > max_age_seconds
-    ]
-    
-    for sid in old_sessions:
+    # Remove old sessions from the front; SESSIONS is ordered oldest-first,
+    # so deletion stops at the first session that is still fresh
+    removed = 0
+    while SESSIONS:
+        sid, session = next(iter(SESSIONS.items()))
+        if session['last_activity'] >= cutoff:
+            break
         del SESSIONS[sid]
+        removed += 1
+    invalidate_response_cache()
     
     return {
         'message': 'Session cleanup completed',
-        'removed_sessions': len(old_sessions),
+        'removed_sessions': removed,
         'remaining_sessions': len(SESSIONS)
     }
 
 
 @router.get("/config", dependencies=[Depends(verify_admin_key)])
+@ttl_cache()
 async def get_configuration() -> dict[str, Any]:
     """
     Get current configuration (non-sensitive).
@@ -180,67 +316,82 @@ async def get_configuration() -> dict[str, Any]:
     }
 
 
-@router.get("/health/detailed", dependencies=[Depends(verify_admin_key)])
-async def detailed_health_check() -> dict[str, Any]:
-    """
-    Detailed health check of all components.
-    
-    Requires admin API key.
-    
-    Returns:
-        Detailed health status
-    """
-    health: dict[str, Any] = {
-        'overall': 'healthy',
-        'components': {}
-    }
-    
-    # Check generator
+def _check_generator() -> dict[str, Any]:
+    """Probe the page generator"""
     try:
         from thalos_prime.lob_babel_generator import address_to_page
         test_page = address_to_page("test")
-        health['components']['generator'] = {
+        return {
             'status': 'healthy',
             'test_passed': len(test_page) == 3200
         }
     except Exception as e:
-        health['components']['generator'] = {
+        return {
             'status': 'unhealthy',
             'error': str(e)
         }
-        health['overall'] = 'degraded'
-    
-    # Check enumerator
+
+
+def _check_enumerator() -> dict[str, Any]:
+    """Probe the address enumerator"""
     try:
         from thalos_prime.lob_babel_enumerator import enumerate_addresses
         test_addrs = enumerate_addresses("test", max_results=1)
-        health['components']['enumerator'] = {
+        return {
             'status': 'healthy',
             'test_passed': len(test_addrs) > 0
         }
     except Exception as e:
-        health['components']['enumerator'] = {
+        return {
             'status': 'unhealthy',
             'error': str(e)
         }
-        health['overall'] = 'degraded'
-    
-    # Check decoder
+
+
+def _check_decoder() -> dict[str, Any]:
+    """Probe the coherence decoder"""
     try:
         from thalos_prime.lob_decoder import score_coherence
         test_score = score_coherence("test text")
-        health['components']['decoder'] = {
+        return {
             'status': 'healthy',
             'test_passed': hasattr(test_score, 'overall_score')
         }
     except Exception as e:
-        health['components']['decoder'] = {
+        return {
             'status': 'unhealthy',
             'error': str(e)
         }
-        health['overall'] = 'degraded'
+
+
+@router.get("/health/detailed", dependencies=[Depends(verify_admin_key)])
+async def detailed_health_check() -> dict[str, Any]:
+    """
+    Detailed health check of all components.
     
-    return health
+    Requires admin API key.
+    
+    Returns:
+        Detailed health status
+    """
+    generator, enumerator, decoder = await asyncio.gather(
+        asyncio.to_thread(_check_generator),
+        asyncio.to_thread(_check_enumerator),
+        asyncio.to_thread(_check_decoder)
+    )
+    
+    components = {
+        'generator': generator,
+        'enumerator': enumerator,
+        'decoder': decoder
+    }
+    
+    healthy = all(c['status'] == 'healthy' for c in components.values())
+    
+    return {
+        'overall': 'healthy' if healthy else 'degraded',
+        'components': components
+    }
 
 
 @router.post("/shutdown", dependencies=[Depends(verify_admin_key)])
@@ -5,7 +5,10 @@ Provides chat endpoint with session management and conversation history.
 """
 
 from fastapi import APIRouter, HTTPException, Depends
+from collections import OrderedDict, deque
+from itertools import islice
 from typing import Any, Optional
+import asyncio
 import time
 import uuid
 
@@ -13,38 +16,105 @@ from thalos_prime.models.api_models import (
     ChatRequest,
     ChatResponse,
     PageResult,
-    AddressInfo,
-    CoherenceInfo,
-    ProvenanceInfo,
-    ConfidenceLevel
+    ConfidenceLevel,
+    SearchMode
 )
-from thalos_prime.lob_babel_generator import address_to_page
+from thalos_prime.lob_babel_generator import address_to_pages
 from thalos_prime.lob_babel_enumerator import enumerate_addresses
-from thalos_prime.lob_decoder import decode_page
+from thalos_prime.lob_decoder import DecodedPage, decode_pages
 
 router = APIRouter()
 
-# In-memory session storage (replace with Redis in production)
-SESSIONS: dict[str, dict[str, Any]] = {}
+# In-memory session storage (replace with Redis in production).
+# Kept ordered by last_activity (oldest first) so expiry scans can stop early.
+SESSIONS: OrderedDict[str, dict[str, Any]] = OrderedDict()
+SESSION_MAX_ENTRIES = 10_000
+SESSION_TTL = 86400  # 24 hours of inactivity
+SESSION_HISTORY_MAX = 200  # Oldest messages are dropped beyond this
+
+
+def _evict_sessions(now: float) -> None:
+    """Drop expired sessions and the least recently used ones beyond the cap"""
+    while SESSIONS:
+        oldest_id, oldest = next(iter(SESSIONS.items()))
+        if now - oldest['last_activity'] <= SESSION_TTL and len(SESSIONS) < SESSION_MAX_ENTRIES:
+            break
+        del SESSIONS[oldest_id]
 
 
 def get_or_create_session(session_id: Optional[str] = None) -> str:
     """Get existing session or create new one"""
-    if session_id and session_id in SESSIONS:
-        # Update last activity
-        SESSIONS[session_id]['last_activity'] = time.time()
-        return session_id
+    now = time.time()
+    if session_id:
+        session = SESSIONS.get(session_id)
+        if session is not None and now - session['last_activity'] <= SESSION_TTL:
+            # Update last activity and move to the most-recent end
+            session['last_activity'] = now
+            SESSIONS.move_to_end(session_id)
+            return session_id
+    
+    # Make room before inserting so the store never exceeds its cap
+    _evict_sessions(now)
     
     # Create new session
     new_session_id = str(uuid.uuid4())
     SESSIONS[new_session_id] = {
-        'created_at': time.time(),
-        'last_activity': time.time(),
-        'history': []
+        'created_at': now,
+        'last_activity': now,
+        'history': deque(maxlen=SESSION_HISTORY_MAX)
     }
     return new_session_id
 
 
+def _decode_candidates(addresses: list[str], query: str) -> list[DecodedPage]:
+    """
+    Generate and decode the candidate addresses for a chat message.
+    
+    ChatRequest caps max_results at 20, far below what is worth splitting
+    across worker processes, so this runs in-process on a worker thread.
+    """
+    return decode_pages(addresses, address_to_pages(addresses), query, 'local')
+
+
+def _to_page_result(decoded: DecodedPage, query: str) -> PageResult:
+    """
+    Convert a decoded page into its API representation.
+    
+    The decoder output is trusted, so the models are assembled without
+    Pydantic validation on the hot path.
+    """
+    return PageResult.build_trusted(
+        address={
+            'hex_address': decoded.address,
+            'wall': None,
+            'shelf': None,
+            'volume': None,
+            'page': None,
+            'url': None
+        },
+        text=decoded.raw_text,
+        snippet=decoded.raw_text[:200] + "...",
+        normalized_text=None,
+        coherence={
+            'overall_score': decoded.coherence.overall_score,
+            'language_score': decoded.coherence.language_score,
+            'structure_score': decoded.coherence.structure_score,
+            'ngram_score': decoded.coherence.ngram_score,
+            'exact_match_score': decoded.coherence.exact_match_score,
+            'confidence_level': ConfidenceLevel(decoded.coherence.confidence_level),
+            'metrics': decoded.coherence.metrics
+        },
+        provenance={
+            'address': decoded.address,
+            'source': decoded.source,
+            'query': query,
+            'timestamp': decoded.timestamp,
+            'normalized': False,
+            'llm_provider': None
+        }
+    )
+
+
 @router.post("/", response_model=ChatResponse)
 async def chat(request: ChatRequest) -> ChatResponse:
     """
@@ -59,7 +129,7 @@ async def chat(request: ChatRequest) -> ChatResponse:
     Returns:
         ChatResponse with reply, session_id, and results
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     # Get or create session
     session_id = get_or_create_session(request.session_id)
@@ -71,60 +141,36 @@ async def chat(request: ChatRequest) -> ChatResponse:
         'timestamp': time.time()
     })
     
+    # Remote lookup is not wired into chat; answer without running the pipeline
+    if request.mode == SearchMode.REMOTE:
+        reply = "Remote search is not yet available in chat. Use 'local' or 'hybrid' mode."
+        SESSIONS[session_id]['history'].append({
+            'role': 'bot',
+            'content': reply,
+            'timestamp': time.time()
+        })
+        return ChatResponse.model_construct(
+            reply=reply,
+            session_id=session_id,
+            results=[],
+            metadata={
+                'query_time_ms': (time.perf_counter_ns() - start_ns) / 1_000_000,
+                'mode': request.mode,
+                'results_count': 0
+            }
+        )
+    
     try:
-        # Search for relevant pages
-        results = []
+        # Search for relevant pages (local and hybrid modes)
+        addresses = enumerate_addresses(request.message, max_results=request.max_results)
         
-        if request.mode in ["local", "hybrid"]:
-            # Enumerate addresses from query
-            addresses = enumerate_addresses(request.message, max_results=request.max_results)
-            
-            # Generate and score pages
-            for addr_info in addresses:
-                address = addr_info['address']
-                page_text = address_to_page(address)
-                
-                # Decode and score
-                decoded = decode_page(
-                    address=address,
-                    text=page_text,
-                    query=request.message,
-                    source='local'
-                )
-                
-                # Convert to PageResult
-                page_result = PageResult(
-                    address=AddressInfo(
-                        hex_address=address,
-                        wall=None,
-                        shelf=None,
-                        volume=None,
-                        page=None,
-                        url=None
-                    ),
-                    text=decoded.raw_text,
-                    snippet=decoded.raw_text[:200] + "...",
-                    normalized_text=None,
-                    coherence=CoherenceInfo(
-                        overall_score=decoded.coherence.overall_score,
-                        language_score=decoded.coherence.language_score,
-                        structure_score=decoded.coherence.structure_score,
-                        ngram_score=decoded.coherence.ngram_score,
-                        exact_match_score=decoded.coherence.exact_match_score,
-                        confidence_level=ConfidenceLevel(decoded.coherence.confidence_level),
-                        metrics=decoded.coherence.metrics
-                    ),
-                    provenance=ProvenanceInfo(
-                        address=decoded.address,
-                        source=decoded.source,
-                        query=request.message,
-                        timestamp=decoded.timestamp,
-                        normalized=False,
-                        llm_provider=None
-                    )
-                )
-                
-                results.append(page_result)
+        # Generate, decode and score off the event loop
+        decoded_pages = await asyncio.to_thread(
+            _decode_candidates,
+            [addr_info['address'] for addr_info in addresses],
+            request.message
+        )
+        results = [_to_page_result(decoded, request.message) for decoded in decoded_pages]
         
         # Sort by coherence score
         results.sort(key=lambda x: x.coherence.overall_score, reverse=True)
@@ -134,9 +180,8 @@ async def chat(request: ChatRequest) -> ChatResponse:
             best_score = results[0].coherence.overall_score
             reply = f"Found {len(results)} results for '{request.message}'. "
             reply += f"Best coherence score: {best_score:.1f}/100 ({results[0].coherence.confidence_level}). "
-            # snippet is always set in our PageResult construction above
-            assert results[0].snippet is not None
-            reply += f"Top result preview: {results[0].snippet[:100]}..."
+            # Preview straight from the page text; pages are longer than the snippet
+            reply += f"Top result preview: {results[0].text[:100]}..."
         else:
             reply = f"No results found for '{request.message}'. Try a different query."
         
@@ -148,9 +193,9 @@ async def chat(request: ChatRequest) -> ChatResponse:
         })
         
         # Calculate query time
-        query_time_ms = (time.time() - start_time) * 1000
+        query_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
         
-        return ChatResponse(
+        return ChatResponse.model_construct(
             reply=reply,
             session_id=session_id,
             results=results,
@@ -188,12 +233,14 @@ async def get_chat_history(session_id: str, limit: int = 20) -> dict[str, Any]:
     if session_id not in SESSIONS:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    history = SESSIONS[session_id]['history'][-limit:]
+    full_history = SESSIONS[session_id]['history']
+    total = len(full_history)
+    history = list(islice(full_history, max(0, total - limit), total))
     
     return {
         'session_id': session_id,
         'history': history,
-        'total_messages': len(SESSIONS[session_id]['history'])
+        'total_messages': total
     }
 
 
@@ -6,25 +6,43 @@ Provides coherence analysis and text normalization functionality.
 
 from fastapi import APIRouter, HTTPException
 from typing import Any, Optional
+import asyncio
+import functools
 import time
 
+from thalos_prime.api.responses import FastJSONResponse
 from thalos_prime.models.api_models import (
     DecodeRequest,
     DecodeResponse,
-    AddressInfo,
-    CoherenceInfo,
-    ProvenanceInfo,
-    NormalizationMode,
-    ConfidenceLevel
+    NormalizationMode
 )
 from thalos_prime.lob_decoder import decode_page, score_coherence, BabelDecoder
 
 router = APIRouter()
 decoder = BabelDecoder()
 
+# Maximum number of batch items decoded concurrently per request
+BATCH_CONCURRENCY = 8
 
-@router.post("/", response_model=DecodeResponse)
-async def decode(request: DecodeRequest) -> DecodeResponse:
+
+@functools.lru_cache(maxsize=32)
+def _decoder_for(
+    language: float,
+    structure: float,
+    ngram: float,
+    exact_match: float
+) -> BabelDecoder:
+    """Return a shared decoder for the given weight configuration"""
+    return BabelDecoder(
+        weight_language=language,
+        weight_structure=structure,
+        weight_ngram=ngram,
+        weight_exact_match=exact_match
+    )
+
+
+@router.post("/", response_model=None, responses={200: {"model": DecodeResponse}})
+async def decode(request: DecodeRequest) -> FastJSONResponse:
     """
     Decode and score a page.
     
@@ -58,42 +76,37 @@ async def decode(request: DecodeRequest) -> DecodeResponse:
             # Heuristic normalization (basic cleaning)
             normalized_text = decoded.raw_text.strip()
         
-        return DecodeResponse(
-            address=AddressInfo(
-                hex_address=request.address,
-                wall=None,
-                shelf=None,
-                volume=None,
-                page=None,
-                url=None
-            ),
-            raw_text=decoded.raw_text,
-            normalized_text=normalized_text,
-            coherence=CoherenceInfo(
-                overall_score=decoded.coherence.overall_score,
-                language_score=decoded.coherence.language_score,
-                structure_score=decoded.coherence.structure_score,
-                ngram_score=decoded.coherence.ngram_score,
-                exact_match_score=decoded.coherence.exact_match_score,
-                confidence_level=ConfidenceLevel(decoded.coherence.confidence_level),
-                metrics=decoded.coherence.metrics
-            ),
-            provenance=ProvenanceInfo(
-                address=decoded.address,
-                source=decoded.source,
-                query=request.query,
-                timestamp=decoded.timestamp,
-                normalized=normalize,
-                llm_provider=None
-            )
-        )
+        # Built from our own decoder output, so serialize it directly instead
+        # of validating it through DecodeResponse; the coherence dataclass
+        # is encoded as-is rather than copied into a dict first
+        return FastJSONResponse({
+            'address': {
+                'hex_address': request.address,
+                'wall': None,
+                'shelf': None,
+                'volume': None,
+                'page': None,
+                'url': None
+            },
+            'raw_text': decoded.raw_text,
+            'normalized_text': normalized_text,
+            'coherence': decoded.coherence,
+            'provenance': {
+                'address': decoded.address,
+                'source': decoded.source,
+                'query': request.query,
+                'timestamp': decoded.timestamp,
+                'normalized': normalize,
+                'llm_provider': None
+            }
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Decode failed: {str(e)}")
 
 
-@router.post("/score")
-async def score_text(text: str, query: Optional[str] = None) -> dict[str, Any]:
+@router.post("/score", response_model=None)
+async def score_text(text: str, query: Optional[str] = None) -> FastJSONResponse:
     """
     Score text coherence without full decoding.
     
@@ -107,20 +120,41 @@ async def score_text(text: str, query: Optional[str] = None) -> dict[str, Any]:
     try:
         coherence = score_coherence(text, query=query)
         
+        # The CoherenceScore fields are exactly the response keys
+        return FastJSONResponse(coherence)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Scoring failed: {str(e)}")
+
+
+def _decode_batch_item(item: dict[str, Any]) -> dict[str, Any]:
+    """Decode one batch item, capturing failures as a result entry"""
+    try:
+        address = item.get('address', 'unknown')
+        text = item.get('text', '')
+        query = item.get('query')
+        
+        decoded = decode_page(
+            address=address,
+            text=text,
+            query=query,
+            source='batch'
+        )
+        
         return {
-            'overall_score': coherence.overall_score,
-            'language_score': coherence.language_score,
-            'structure_score': coherence.structure_score,
-            'ngram_score': coherence.ngram_score,
-            'exact_match_score': coherence.exact_match_score,
-            'confidence_level': coherence.confidence_level,
-            'metrics': coherence.metrics
+            'address': address,
+            'coherence_score': decoded.coherence.overall_score,
+            'confidence_level': decoded.coherence.confidence_level,
+            'success': True
         }
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Scoring failed: {str(e)}")
+        return {
+            'address': item.get('address', 'unknown'),
+            'error': str(e),
+            'success': False
+        }
 
 
-@router.post("/batch")
+@router.post("/batch", response_class=FastJSONResponse)
 async def decode_batch(items: list[dict[str, Any]]) -> dict[str, Any]:
     """
     Decode multiple pages in batch.
@@ -134,38 +168,19 @@ async def decode_batch(items: list[dict[str, Any]]) -> dict[str, Any]:
     if len(items) > 50:
         raise HTTPException(status_code=400, detail="Batch size limited to 50 items")
     
-    results = []
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
     
-    for item in items:
-        try:
-            address = item.get('address', 'unknown')
-            text = item.get('text', '')
-            query = item.get('query')
-            
-            decoded = decode_page(
-                address=address,
-                text=text,
-                query=query,
-                source='batch'
-            )
-            
-            results.append({
-                'address': address,
-                'coherence_score': decoded.coherence.overall_score,
-                'confidence_level': decoded.coherence.confidence_level,
-                'success': True
-            })
-        except Exception as e:
-            results.append({
-                'address': item.get('address', 'unknown'),
-                'error': str(e),
-                'success': False
-            })
+    async def _bounded(item: dict[str, Any]) -> dict[str, Any]:
+        async with semaphore:
+            return await asyncio.to_thread(_decode_batch_item, item)
+    
+    results = await asyncio.gather(*[_bounded(item) for item in items])
+    successful = sum(result['success'] for result in results)
     
     return {
         'total': len(items),
-        'successful': sum(1 for r in results if r.get('success')),
-        'failed': sum(1 for r in results if not r.get('success')),
+        'successful': successful,
+        'failed': len(results) - successful,
         'results': results
     }
 
@@ -190,13 +205,8 @@ async def update_decoder_weights(
         Updated weights
     """
     try:
-        # Create new decoder with custom weights
-        custom_decoder = BabelDecoder(
-            weight_language=language,
-            weight_structure=structure,
-            weight_ngram=ngram,
-            weight_exact_match=exact_match
-        )
+        # Reuse a decoder configured with these weights
+        custom_decoder = _decoder_for(language, structure, ngram, exact_match)
         
         return {
             'weights': {
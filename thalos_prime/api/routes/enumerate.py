@@ -6,8 +6,10 @@ Provides query-to-address mapping functionality.
 
 from fastapi import APIRouter, HTTPException
 from typing import Any
+import functools
 import time
 
+from thalos_prime.api.responses import FastJSONResponse
 from thalos_prime.models.api_models import (
     EnumerateRequest,
     EnumerateResponse
@@ -17,6 +19,15 @@ from thalos_prime.lob_babel_enumerator import enumerate_addresses, query_to_addr
 router = APIRouter()
 enumerator = BabelEnumerator()
 
+# Maximum substring/address pairs returned by /substrings
+SUBSTRING_RESULT_LIMIT = 100
+
+
+@functools.lru_cache(maxsize=32)
+def _enumerator_for(min_size: int, max_size: int) -> BabelEnumerator:
+    """Return a shared enumerator for the given n-gram size range"""
+    return BabelEnumerator(max_ngram_size=max_size, min_ngram_size=min_size)
+
 
 @router.post("/", response_model=EnumerateResponse)
 async def enumerate(request: EnumerateRequest) -> EnumerateResponse:
@@ -32,7 +43,7 @@ async def enumerate(request: EnumerateRequest) -> EnumerateResponse:
     Returns:
         EnumerateResponse with addresses and metadata
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     try:
         # Enumerate addresses
@@ -43,7 +54,7 @@ async def enumerate(request: EnumerateRequest) -> EnumerateResponse:
         )
         
         # Calculate enumeration time
-        enumeration_time_ms = (time.time() - start_time) * 1000
+        enumeration_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
         
         return EnumerateResponse(
             query=request.query,
@@ -98,11 +109,8 @@ async def extract_ngrams(text: str, min_size: int = 2, max_size: int = 5) -> dic
         List of n-grams
     """
     try:
-        # Create enumerator with custom sizes
-        custom_enumerator = BabelEnumerator(
-            max_ngram_size=max_size,
-            min_ngram_size=min_size
-        )
+        # Reuse an enumerator configured with these sizes
+        custom_enumerator = _enumerator_for(min_size, max_size)
         
         ngrams = custom_enumerator._extract_ngrams(text)
         
@@ -143,7 +151,7 @@ async def find_common_addresses(query1: str, query2: str, max_results: int = 10)
         raise HTTPException(status_code=500, detail=f"Common address search failed: {str(e)}")
 
 
-@router.post("/substrings")
+@router.post("/substrings", response_class=FastJSONResponse)
 async def enumerate_substrings(text: str, substring_length: int = 10) -> dict[str, Any]:
     """
     Enumerate all substrings of a given length.
@@ -156,16 +164,19 @@ async def enumerate_substrings(text: str, substring_length: int = 10) -> dict[st
         List of substring-address pairs
     """
     try:
-        results = enumerator.enumerate_substrings(text, substring_length=substring_length)
+        # Stream pairs so only the returned ones are kept in memory
+        results = []
+        total_count = 0
+        for sub, addr in enumerator.iter_substrings(text, substring_length=substring_length):
+            total_count += 1
+            if total_count <= SUBSTRING_RESULT_LIMIT:
+                results.append({'substring': sub, 'address': addr})
         
         return {
             'text': text,
             'substring_length': substring_length,
-            'results': [
-                {'substring': sub, 'address': addr}
-                for sub, addr in results[:100]  # Limit to 100 for performance
-            ],
-            'total_count': len(results)
+            'results': results,
+            'total_count': total_count
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Substring enumeration failed: {str(e)}")
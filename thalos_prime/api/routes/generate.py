@@ -6,6 +6,8 @@ Provides deterministic page generation from addresses or queries.
 
 from fastapi import APIRouter, HTTPException
 from typing import Any, Optional
+import asyncio
+import functools
 import time
 
 from thalos_prime.models.api_models import (
@@ -14,9 +16,64 @@ from thalos_prime.models.api_models import (
     AddressInfo
 )
 from thalos_prime.lob_babel_generator import address_to_page, text_to_address, BabelGenerator
+from thalos_prime.api.workers import map_chunks
 
 router = APIRouter()
-generator = BabelGenerator()
+
+
+@functools.cache
+def _get_generator() -> BabelGenerator:
+    """Return this process's generator, built on first use"""
+    return BabelGenerator()
+
+
+# Query -> address is deterministic, so repeated queries are served from memory.
+# GenerateRequest.query is unbounded, so only page-sized queries are cached.
+_cached_text_to_address = functools.lru_cache(maxsize=8192)(text_to_address)
+
+
+def _query_to_address(query: str) -> str:
+    """Map a query to its address, caching only queries up to one page long"""
+    if len(query) > BabelGenerator.PAGE_LENGTH:
+        return text_to_address(query)
+    return _cached_text_to_address(query)
+
+
+def _generate_and_validate(address: str, validate: bool) -> tuple[str, bool]:
+    """Generate a page and optionally validate it (CPU-bound)"""
+    page_text = address_to_page(address)
+    
+    valid = True
+    if validate:
+        is_valid, _ = _get_generator().validate_page(page_text)
+        valid = is_valid
+    
+    return page_text, valid
+
+
+def _process_chunk(addresses: list[str], validate: bool) -> list[dict[str, Any]]:
+    """
+    Generate a slice of a batch inside a worker process.
+    
+    Module-level so it can be pickled for the process pool.
+    """
+    results = []
+    for address in addresses:
+        try:
+            page_text, valid = _generate_and_validate(address, validate)
+            results.append({
+                'address': address,
+                'text': page_text,
+                'valid': valid,
+                'success': True
+            })
+        except Exception as e:
+            results.append({
+                'address': address,
+                'error': str(e),
+                'success': False
+            })
+    return results
 
 
 @router.post("/", response_model=GenerateResponse)
@@ -32,28 +89,26 @@ async def generate_page(request: GenerateRequest) -> GenerateResponse:
     Returns:
         GenerateResponse with generated page
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     try:
         # Determine address
         if request.address:
             address = request.address
         elif request.query:
-            address = text_to_address(request.query)
+            address = await asyncio.to_thread(_query_to_address, request.query)
         else:
             raise HTTPException(status_code=400, detail="Either address or query must be provided")
         
-        # Generate page
-        page_text = address_to_page(address)
-        
-        # Validate if requested
-        valid = True
-        if request.validate_page:
-            is_valid, error = generator.validate_page(page_text)
-            valid = is_valid
+        # Generate (and validate if requested) off the event loop
+        page_text, valid = await asyncio.to_thread(
+            _generate_and_validate,
+            address,
+            request.validate_page
+        )
         
         # Calculate generation time
-        generation_time_ms = (time.time() - start_time) * 1000
+        generation_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
         
         return GenerateResponse(
             address=AddressInfo(
@@ -88,34 +143,23 @@ async def generate_batch(addresses: list[str], validate: bool = True) -> dict[st
     if len(addresses) > 100:
         raise HTTPException(status_code=400, detail="Batch size limited to 100 addresses")
     
-    results = []
+    # At most one chunk per core so each worker pays the IPC cost once;
+    # small batches run in-process
+    chunk_results = await map_chunks(_process_chunk, addresses, validate)
     
-    for address in addresses:
-        try:
-            page_text = address_to_page(address)
-            
-            valid = True
-            if validate:
-                is_valid, _ = generator.validate_page(page_text)
-                valid = is_valid
-            
-            results.append({
-                'address': address,
-                'text': page_text,
-                'valid': valid,
-                'success': True
-            })
-        except Exception as e:
-            results.append({
-                'address': address,
-                'error': str(e),
-                'success': False
-            })
+    # Flatten and count successes in a single pass
+    results = []
+    successful = 0
+    for chunk in chunk_results:
+        for result in chunk:
+            results.append(result)
+            if result['success']:
+                successful += 1
     
     return {
         'total': len(addresses),
-        'successful': sum(1 for r in results if r.get('success')),
-        'failed': sum(1 for r in results if not r.get('success')),
+        'successful': successful,
+        'failed': len(results) - successful,
         'results': results
     }
 
@@ -133,10 +177,10 @@ async def generate_random_page(seed: Optional[str] = None) -> dict[str, Any]:
     """
     try:
         # Generate random address
-        address = generator.generate_random_address(seed=seed)
+        address = _get_generator().generate_random_address(seed=seed)
         
         # Generate page
-        page_text = address_to_page(address)
+        page_text = await asyncio.to_thread(address_to_page, address)
         
         return {
             'address': address,
@@ -161,14 +205,14 @@ async def validate_page(address: str, text: str) -> dict[str, Any]:
         Validation result
     """
     try:
-        is_valid, error = generator.validate_page(text)
+        is_valid, error = await asyncio.to_thread(_get_generator().validate_page, text)
         
         return {
             'address': address,
             'valid': is_valid,
             'error': error if not is_valid else None,
             'length': len(text),
-            'expected_length': generator.PAGE_LENGTH
+            'expected_length': BabelGenerator.PAGE_LENGTH
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Validation failed: {str(e)}")
@@ -4,30 +4,35 @@ Main Routes - Root endpoints
 Provides the main landing page and UI serving.
 """
 
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, Request, Response
 from fastapi.responses import HTMLResponse, FileResponse
-from typing import Any
+from typing import Any, Optional
+import gzip
+import hashlib
 import os
 
 router = APIRouter()
 
+# Path to the UI page at the repository root
+INDEX_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), "index.html")
 
-@router.get("/", response_class=HTMLResponse)
-async def root() -> HTMLResponse:
-    """
-    Serve the main UI page.
-    
-    Returns the Matrix-style interface for Thalos Prime.
-    """
-    # Check if index.html exists in root
-    index_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), "index.html")
-    
-    if os.path.exists(index_path):
-        with open(index_path, 'r') as f:
-            return HTMLResponse(content=f.read())
-    
-    # Return basic HTML if file doesn't exist
-    return HTMLResponse(content="""
+
+def _load_index() -> Optional[bytes]:
+    """Read index.html once; None when it is not shipped"""
+    if not os.path.exists(INDEX_PATH):
+        return None
+    with open(INDEX_PATH, 'rb') as f:
+        return f.read()
+
+
+# Served from memory instead of re-reading the file on every request.
+# The page is large and static, so it is also compressed once up front;
+# the app's gzip middleware skips this route, which picks the encoding.
+INDEX_HTML = _load_index()
+INDEX_HTML_GZIP = gzip.compress(INDEX_HTML, compresslevel=9) if INDEX_HTML is not None else None
+
+# Basic HTML used when index.html doesn't exist, encoded once
+FALLBACK_HTML = b"""
     <!DOCTYPE html>
     <html>
     <head>
@@ -53,7 +58,95 @@ async def root() -> HTMLResponse:
         <p><a href="/api/v1/status">API Status</a></p>
     </body>
     </html>
-    """)
+    """
+
+
+# Validator for conditional GETs of the landing page. Weak, so the same tag
+# covers both the identity and gzip encodings of the page.
+INDEX_ETAG = 'W/"' + hashlib.blake2b(INDEX_HTML or FALLBACK_HTML, digest_size=8).hexdigest() + '"'
+INDEX_HEADERS = {
+    'ETag': INDEX_ETAG,
+    'Cache-Control': 'public, max-age=300',
+    'Vary': 'Accept-Encoding'
+}
+
+
+def _etag_matches(if_none_match: str) -> bool:
+    """Check an If-None-Match header against the page ETag (weak comparison)"""
+    if if_none_match.strip() == "*":
+        return True
+    
+    opaque = INDEX_ETAG[2:]
+    return any(
+        tag.strip().removeprefix("W/") == opaque
+        for tag in if_none_match.split(",")
+    )
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """
+    Check whether an Accept-Encoding header allows a gzip response.
+    
+    Honours q-values, so "gzip;q=0" refuses gzip; an explicit gzip entry
+    takes precedence over a "*" wildcard.
+    
+    Args:
+        accept_encoding: Accept-Encoding header value
+    
+    Returns:
+        True if gzip has a non-zero quality
+    """
+    gzip_q: Optional[float] = None
+    wildcard_q: Optional[float] = None
+    
+    for entry in accept_encoding.split(","):
+        coding, _, params = entry.partition(";")
+        coding = coding.strip().lower()
+        if coding not in ("gzip", "x-gzip", "*"):
+            continue
+        
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        
+        if coding == "*":
+            wildcard_q = quality
+        else:
+            gzip_q = quality
+    
+    if gzip_q is None:
+        gzip_q = wildcard_q
+    return gzip_q is not None and gzip_q > 0
+
+
+@router.get("/", response_class=HTMLResponse)
+async def root(request: Request) -> Response:
+    """
+    Serve the main UI page.
+    
+    Returns the Matrix-style interface for Thalos Prime.
+    """
+    # Revalidation: the client's copy is current, send no body. The headers
+    # (ETag with Vary: Accept-Encoding) match the full responses.
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match):
+        return Response(status_code=304, headers=INDEX_HEADERS)
+    
+    if INDEX_HTML_GZIP is not None and _accepts_gzip(request.headers.get("accept-encoding", "")):
+        return HTMLResponse(
+            content=INDEX_HTML_GZIP,
+            headers={**INDEX_HEADERS, 'Content-Encoding': 'gzip'}
+        )
+    
+    if INDEX_HTML is not None:
+        return HTMLResponse(content=INDEX_HTML, headers=INDEX_HEADERS)
+    
+    return HTMLResponse(content=FALLBACK_HTML, headers=INDEX_HEADERS)
 
 
 @router.get("/api/v1/status")
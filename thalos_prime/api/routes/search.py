@@ -5,49 +5,196 @@ Provides search functionality with detailed results and filtering.
 """
 
 from fastapi import APIRouter, HTTPException, Query as QueryParam
+from fastapi.responses import Response
+from collections import OrderedDict
 from typing import Any, List, Optional
+import hashlib
 import time
 
 from thalos_prime.models.api_models import (
     SearchRequest,
     SearchResponse,
     PageResult,
-    AddressInfo,
-    CoherenceInfo,
-    ProvenanceInfo,
     SearchMode,
-    ConfidenceLevel
+    ConfidenceLevel,
+    PAGE_RESULT_LIST_ADAPTER
 )
-from thalos_prime.lob_babel_generator import address_to_page
+from thalos_prime.api.responses import dumps
+from thalos_prime.api.workers import map_chunks
+from thalos_prime.lob_babel_generator import address_to_pages
 from thalos_prime.lob_babel_enumerator import enumerate_addresses
 from thalos_prime.lob_decoder import decode_page, score_coherence
 
 router = APIRouter()
 
-# Simple in-memory cache (replace with Redis in production)
-SEARCH_CACHE: dict[str, tuple[dict[str, Any], float]] = {}
+# Simple in-memory cache (replace with Redis in production).
+# Values hold the pre-encoded JSON results array, never live Pydantic models.
+# Kept in LRU order (least recently used first) and bounded in size.
+SEARCH_CACHE: OrderedDict[str, tuple[dict[str, Any], float]] = OrderedDict()
 CACHE_TTL = 3600  # 1 hour
+CACHE_MAX_ENTRIES = 10_000
+CACHE_KEY_PREFIX = "thalos:search:"
+
+
+def make_cache_key(query: str, max_results: int, mode: str, min_score: float) -> str:
+    """
+    Build a fixed-length cache key for a search.
+    
+    Queries can be long, so the parameters are hashed rather than
+    concatenated; the prefixed form also suits a shared key-value store.
+    """
+    raw = f"{query}|{max_results}|{mode}|{min_score}"
+    return CACHE_KEY_PREFIX + hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+# Running totals over SEARCH_CACHE so stats never rescan the entries.
+# Timestamps are summed as integer nanoseconds: adding and removing the same
+# entry cancels exactly, where epoch floats would accumulate rounding error.
+_CACHE_TOTALS: dict[str, int] = {'bytes': 0, 'timestamp_ns_sum': 0}
+
+
+def _timestamp_ns(timestamp: float) -> int:
+    """Convert an entry timestamp to the integer form used in the totals"""
+    return round(timestamp * 1_000_000_000)
+
+
+def _account(data: dict[str, Any], timestamp: float, sign: int) -> None:
+    """Add (sign=1) or remove (sign=-1) an entry from the running totals"""
+    _CACHE_TOTALS['bytes'] += sign * len(data['results_json'])
+    _CACHE_TOTALS['timestamp_ns_sum'] += sign * _timestamp_ns(timestamp)
+
+
+def _drop_cached(cache_key: str) -> None:
+    """Remove one entry from the cache and the running totals"""
+    data, timestamp = SEARCH_CACHE.pop(cache_key)
+    _account(data, timestamp, -1)
+
+
+def clear_cache() -> int:
+    """
+    Remove every cached search.
+    
+    Returns:
+        Number of entries removed
+    """
+    count = len(SEARCH_CACHE)
+    SEARCH_CACHE.clear()
+    _CACHE_TOTALS['bytes'] = 0
+    _CACHE_TOTALS['timestamp_ns_sum'] = 0
+    return count
 
 
 def get_cached_search(cache_key: str) -> Optional[dict[str, Any]]:
     """Get cached search results if available and not expired"""
-    if cache_key in SEARCH_CACHE:
-        cached_data, timestamp = SEARCH_CACHE[cache_key]
-        if time.time() - timestamp < CACHE_TTL:
-            return cached_data
-        else:
-            # Expired, remove from cache
-            del SEARCH_CACHE[cache_key]
-    return None
+    entry = SEARCH_CACHE.get(cache_key)
+    if entry is None:
+        return None
+    
+    cached_data, timestamp = entry
+    if time.time() - timestamp >= CACHE_TTL:
+        # Expired, remove from cache
+        _drop_cached(cache_key)
+        return None
+    
+    # Mark as most recently used
+    SEARCH_CACHE.move_to_end(cache_key)
+    return cached_data
 
 
 def cache_search(cache_key: str, data: dict[str, Any]) -> None:
-    """Cache search results"""
-    SEARCH_CACHE[cache_key] = (data, time.time())
+    """Cache search results, evicting least recently used entries beyond the cap"""
+    if cache_key in SEARCH_CACHE:
+        _drop_cached(cache_key)
+    
+    timestamp = time.time()
+    SEARCH_CACHE[cache_key] = (data, timestamp)
+    _account(data, timestamp, 1)
+    
+    while len(SEARCH_CACHE) > CACHE_MAX_ENTRIES:
+        _drop_cached(next(iter(SEARCH_CACHE)))
+
+
+def _search_response(
+    request: SearchRequest,
+    results_json: bytes,
+    total_found: int,
+    cached: bool,
+    metadata: dict[str, Any]
+) -> Response:
+    """
+    Assemble a SearchResponse body around an already-encoded results array.
+    
+    The results dominate the payload, so they are encoded once when the
+    search runs and spliced in verbatim on every cache hit.
+    """
+    envelope = dumps({
+        'query': request.query,
+        'total_found': total_found,
+        'mode': request.mode.value,
+        'cached': cached,
+        'metadata': metadata
+    })
+    return Response(
+        content=envelope[:-1] + b',"results":' + results_json + b'}',
+        media_type="application/json",
+        headers={'X-Cache': 'HIT' if cached else 'MISS'}
+    )
+
+
+def _score_chunk(addresses: list[str], query: str, min_score: float) -> list[PageResult]:
+    """
+    Generate, decode and filter a slice of candidate addresses.
+    
+    Runs inside a worker process, so it is kept at module level.
+    """
+    results: list[PageResult] = []
+    for address, page_text in zip(addresses, address_to_pages(addresses)):
+        # Decode and score
+        decoded = decode_page(
+            address=address,
+            text=page_text,
+            query=query,
+            source='local'
+        )
+        
+        # Filter by minimum score
+        if decoded.coherence.overall_score >= min_score:
+            # Decoder output is trusted; skip re-validation
+            results.append(PageResult.build_trusted(
+                address={
+                    'hex_address': address,
+                    'wall': None,
+                    'shelf': None,
+                    'volume': None,
+                    'page': None,
+                    'url': None
+                },
+                text=decoded.raw_text,
+                snippet=decoded.raw_text[:200] + "...",
+                normalized_text=None,
+                coherence={
+                    'overall_score': decoded.coherence.overall_score,
+                    'language_score': decoded.coherence.language_score,
+                    'structure_score': decoded.coherence.structure_score,
+                    'ngram_score': decoded.coherence.ngram_score,
+                    'exact_match_score': decoded.coherence.exact_match_score,
+                    'confidence_level': ConfidenceLevel(decoded.coherence.confidence_level),
+                    'metrics': decoded.coherence.metrics
+                },
+                provenance={
+                    'address': decoded.address,
+                    'source': decoded.source,
+                    'query': query,
+                    'timestamp': decoded.timestamp,
+                    'normalized': False,
+                    'llm_provider': None
+                }
+            ))
+    return results
 
 
 @router.post("/", response_model=SearchResponse)
-async def search(request: SearchRequest) -> SearchResponse:
+async def search(request: SearchRequest) -> Response:
     """
     Search for pages matching the query.
     
@@ -60,28 +207,27 @@ async def search(request: SearchRequest) -> SearchResponse:
     Returns:
         SearchResponse with results and metadata
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     # Create cache key
-    cache_key = f"{request.query}:{request.max_results}:{request.mode}:{request.min_score}"
+    cache_key = make_cache_key(request.query, request.max_results, request.mode, request.min_score)
     
     # Check cache
     cached_results = get_cached_search(cache_key)
     if cached_results:
-        return SearchResponse(
-            query=request.query,
-            results=cached_results['results'],
-            total_found=cached_results['total_found'],
-            mode=request.mode,
+        return _search_response(
+            request,
+            cached_results['results_json'],
+            cached_results['total_found'],
             cached=True,
             metadata={
-                'query_time_ms': (time.time() - start_time) * 1000,
+                'query_time_ms': (time.perf_counter_ns() - start_ns) / 1_000_000,
                 'cache_hit': True
             }
         )
     
     try:
-        results = []
+        results: list[PageResult] = []
         
         if request.mode in [SearchMode.LOCAL, SearchMode.HYBRID]:
             # Local generation mode
@@ -91,51 +237,15 @@ async def search(request: SearchRequest) -> SearchResponse:
                 depth=2
             )
             
-            for addr_info in addresses:
-                address = addr_info['address']
-                page_text = address_to_page(address)
-                
-                # Decode and score
-                decoded = decode_page(
-                    address=address,
-                    text=page_text,
-                    query=request.query,
-                    source='local'
-                )
-                
-                # Filter by minimum score
-                if decoded.coherence.overall_score >= request.min_score:
-                    page_result = PageResult(
-                        address=AddressInfo(
-                            hex_address=address,
-                            wall=None,
-                            shelf=None,
-                            volume=None,
-                            page=None,
-                            url=None
-                        ),
-                        text=decoded.raw_text,
-                        snippet=decoded.raw_text[:200] + "...",
-                        normalized_text=None,
-                        coherence=CoherenceInfo(
-                            overall_score=decoded.coherence.overall_score,
-                            language_score=decoded.coherence.language_score,
-                            structure_score=decoded.coherence.structure_score,
-                            ngram_score=decoded.coherence.ngram_score,
-                            exact_match_score=decoded.coherence.exact_match_score,
-                            confidence_level=ConfidenceLevel(decoded.coherence.confidence_level),
-                            metrics=decoded.coherence.metrics
-                        ),
-                        provenance=ProvenanceInfo(
-                            address=decoded.address,
-                            source=decoded.source,
-                            query=request.query,
-                            timestamp=decoded.timestamp,
-                            normalized=False,
-                            llm_provider=None
-                        )
-                    )
-                    results.append(page_result)
+            # Generate and score, split across worker processes when the
+            # batch is large enough to pay for the round trip
+            chunk_results = await map_chunks(
+                _score_chunk,
+                [addr_info['address'] for addr_info in addresses],
+                request.query,
+                request.min_score
+            )
+            results = [result for chunk in chunk_results for result in chunk]
         
         # Sort by coherence score
         results.sort(key=lambda x: x.coherence.overall_score, reverse=True)
@@ -143,21 +253,21 @@ async def search(request: SearchRequest) -> SearchResponse:
         # Limit to max_results
         results = results[:request.max_results]
         
-        # Cache results
+        # Encode the results once and cache the bytes
+        results_json = PAGE_RESULT_LIST_ADAPTER.dump_json(results)
         cache_data = {
-            'results': results,
+            'results_json': results_json,
             'total_found': len(results)
         }
         cache_search(cache_key, cache_data)
         
         # Calculate query time
-        query_time_ms = (time.time() - start_time) * 1000
+        query_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
         
-        return SearchResponse(
-            query=request.query,
-            results=results,
-            total_found=len(results),
-            mode=request.mode,
+        return _search_response(
+            request,
+            results_json,
+            len(results),
             cached=False,
             metadata={
                 'query_time_ms': query_time_ms,
@@ -170,8 +280,15 @@ async def search(request: SearchRequest) -> SearchResponse:
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
 
 
+# Suggestion templates appended to the partial query
+SUGGESTION_SUFFIXES = (" meaning", " definition", " explained", " analysis", " theory")
+
+
 @router.get("/suggestions")
-async def get_search_suggestions(q: str = QueryParam(..., min_length=1)) -> dict[str, Any]:
+async def get_search_suggestions(
+    response: Response,
+    q: str = QueryParam(..., min_length=1)
+) -> dict[str, Any]:
     """
     Get search query suggestions.
     
@@ -182,18 +299,13 @@ async def get_search_suggestions(q: str = QueryParam(..., min_length=1)) -> dict
         List of suggested queries
     """
     # This would normally query a database or search index
-    # For now, return some example suggestions
-    suggestions = [
-        f"{q} meaning",
-        f"{q} definition",
-        f"{q} explained",
-        f"{q} analysis",
-        f"{q} theory"
-    ]
+    # For now, return some example suggestions. They depend only on q,
+    # so let clients and shared caches reuse them briefly.
+    response.headers['Cache-Control'] = 'public, max-age=60'
     
     return {
         'query': q,
-        'suggestions': suggestions[:5]
+        'suggestions': [q + suffix for suffix in SUGGESTION_SUFFIXES]
     }
 
 
@@ -205,8 +317,7 @@ async def clear_search_cache() -> dict[str, Any]:
     Returns:
         Success message with number of entries cleared
     """
-    count = len(SEARCH_CACHE)
-    SEARCH_CACHE.clear()
+    count = clear_cache()
     
     return {
         'message': 'Search cache cleared successfully',
@@ -224,18 +335,13 @@ async def get_cache_stats() -> dict[str, Any]:
     """
     total_entries = len(SEARCH_CACHE)
     
-    # Calculate cache size and age
-    cache_sizes = []
-    cache_ages = []
-    current_time = time.time()
-    
-    for cached_data, timestamp in SEARCH_CACHE.values():
-        # Rough size estimation
-        cache_sizes.append(len(str(cached_data)))
-        cache_ages.append(current_time - timestamp)
-    
-    avg_size = sum(cache_sizes) / len(cache_sizes) if cache_sizes else 0
-    avg_age = sum(cache_ages) / len(cache_ages) if cache_ages else 0
+    # Averages come from the running totals kept on insert/evict
+    if total_entries:
+        avg_size = _CACHE_TOTALS['bytes'] / total_entries
+        avg_age = time.time() - _CACHE_TOTALS['timestamp_ns_sum'] / total_entries / 1_000_000_000
+    else:
+        avg_size = 0
+        avg_age = 0
     
     return {
         'total_entries': total_entries,
@@ -5,22 +5,33 @@ This module provides the main FastAPI application with all configuration,
 middleware, and route registration.
 """
 
+import asyncio
 import time
 from contextlib import asynccontextmanager
-from typing import Optional, AsyncIterator, Any, Callable, Awaitable
+from typing import Optional, AsyncIterator, Any, Callable, Awaitable, Iterable
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 from fastapi.exception_handlers import (
     request_validation_exception_handler,
     http_exception_handler
 )
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError, HTTPException
 import logging
 
 from thalos_prime.models.api_models import ErrorResponse
+from thalos_prime.api.responses import FastJSONResponse
 from thalos_prime.api import config as api_config
+from thalos_prime.api.routes.chat import router as chat_router
+from thalos_prime.api.routes.search import router as search_router
+from thalos_prime.api.routes.generate import router as generate_router
+from thalos_prime.api.routes.enumerate import router as enumerate_router
+from thalos_prime.api.routes.decode import router as decode_router
+from thalos_prime.api.routes.admin import router as admin_router
+from thalos_prime.api.routes.main import router as main_router
 from thalos_prime import __version__
 
 # Configure logging
@@ -34,6 +45,26 @@ logger = logging.getLogger(__name__)
 START_TIME = time.time()
 
 
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """
+    GZipMiddleware that leaves some paths alone.
+    
+    Routes that serve precompressed bodies negotiate Accept-Encoding
+    themselves (including q-values, which GZipMiddleware ignores), so
+    their responses are passed through unchanged.
+    """
+    
+    def __init__(self, app: ASGIApp, exclude_paths: Iterable[str] = (), **kwargs: Any) -> None:
+        super().__init__(app, **kwargs)
+        self.exclude_paths = frozenset(exclude_paths)
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """
@@ -77,12 +108,38 @@ async def initialize_services() -> None:
     
     # Initialize worker queues
     logger.info("Initializing worker queues...")
+    from thalos_prime.api.workers import cpu_count, get_cpu_pool
+    pool = get_cpu_pool()
+    
+    # Pay first-call costs during boot rather than on the first request:
+    # fork the pool's workers and exercise the generate/decode path
+    logger.info("Warming up generator and decoder...")
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(
+        asyncio.to_thread(_warmup),
+        *[loop.run_in_executor(pool, _warmup) for _ in range(cpu_count())]
+    )
     
     logger.info("Service initialization complete")
 
 
+def _warmup() -> None:
+    """Run one page through generation, validation and decoding"""
+    from thalos_prime.lob_babel_generator import BabelGenerator, address_to_page
+    from thalos_prime.lob_decoder import decode_page
+    
+    address = "0" * 40
+    page_text = address_to_page(address)
+    BabelGenerator().validate_page(page_text)
+    decode_page(address=address, text=page_text, query="warmup", source='local')
+
+
 async def cleanup_services() -> None:
     """Cleanup all application services"""
+    # Stop background samplers
+    from thalos_prime.api.routes.admin import stop_cpu_sampler
+    await stop_cpu_sampler()
+    
     # Close database connections
     logger.info("Closing database connections...")
     
@@ -91,6 +148,8 @@ async def cleanup_services() -> None:
     
     # Shutdown worker queues
     logger.info("Shutting down worker queues...")
+    from thalos_prime.api.workers import shutdown_cpu_pool
+    shutdown_cpu_pool()
     
     logger.info("Service cleanup complete")
 
@@ -131,70 +190,77 @@ def create_app() -> FastAPI:
         """,
         version=__version__,
         lifespan=lifespan,
+        default_response_class=FastJSONResponse,
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json"
     )
     
-    # Configure CORS
+    # Configure CORS only when cross-origin clients are configured
+    # (THALOS_CORS_ORIGINS); the bundled UI is same-origin and needs none
+    cors_origins = api_config.config.cors_origins
+    if cors_origins:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=cors_origins,
+            # Credentials can't be combined with a wildcard origin
+            allow_credentials="*" not in cors_origins,
+            allow_methods=["GET", "POST", "DELETE"],
+            allow_headers=["*"],
+        )
+    
+    # Add GZip compression; small bodies aren't worth the CPU, and level 6
+    # is several times faster than the default 9 for a few percent in size.
+    # The landing page serves its own precompressed copy.
     app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],  # Configure appropriately for production
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        SelectiveGZipMiddleware,
+        exclude_paths=("/",),
+        minimum_size=4096,
+        compresslevel=6
     )
     
-    # Add GZip compression
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
-    
     # Add custom middleware
     @app.middleware("http")
     async def add_process_time_header(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
         """Add X-Process-Time header to all responses"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         response = await call_next(request)
-        process_time = time.time() - start_time
+        process_time = (time.perf_counter_ns() - start_ns) / 1_000_000_000
         response.headers["X-Process-Time"] = f"{process_time:.4f}"
         return response
     
-    @app.middleware("http")
-    async def log_requests(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
-        """Log all incoming requests"""
-        logger.info(f"Request: {request.method} {request.url.path}")
-        response = await call_next(request)
-        logger.info(f"Response: {response.status_code}")
-        return response
+    # Per-request logging is left to uvicorn's access log
     
     # Custom exception handlers
     @app.exception_handler(HTTPException)
-    async def custom_http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+    async def custom_http_exception_handler(request: Request, exc: HTTPException) -> FastJSONResponse:
         """Handle HTTP exceptions with custom error response"""
         error_response = ErrorResponse(
             error=f"HTTP{exc.status_code}",
             message=exc.detail,
             details={"path": str(request.url.path)}
         )
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=exc.status_code,
-            content=error_response.dict()
+            content=error_response.model_dump()
         )
     
     @app.exception_handler(RequestValidationError)
-    async def custom_validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+    async def custom_validation_exception_handler(request: Request, exc: RequestValidationError) -> FastJSONResponse:
         """Handle validation errors with custom error response"""
         error_response = ErrorResponse(
             error="ValidationError",
             message="Request validation failed",
-            details={"errors": exc.errors()}
+            # ctx may hold the raised exception object, which JSON cannot encode
+            details={"errors": jsonable_encoder(exc.errors())}
         )
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            content=error_response.dict()
+            content=error_response.model_dump()
         )
     
     @app.exception_handler(Exception)
-    async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    async def global_exception_handler(request: Request, exc: Exception) -> FastJSONResponse:
         """Handle unexpected exceptions"""
         logger.error(f"Unexpected error: {exc}", exc_info=True)
         error_response = ErrorResponse(
@@ -202,9 +268,9 @@ def create_app() -> FastAPI:
             message="An unexpected error occurred",
             details={"type": type(exc).__name__}
         )
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content=error_response.dict()
+            content=error_response.model_dump()
         )
     
     # Register routes
@@ -231,37 +297,16 @@ def register_routes(app: FastAPI) -> None:
     Args:
         app: FastAPI application instance
     """
-    # Import routers (lazy import to avoid circular dependencies)
-    try:
-        from thalos_prime.api.routes.chat import router as chat_router
-        from thalos_prime.api.routes.search import router as search_router
-        from thalos_prime.api.routes.generate import router as generate_router
-        from thalos_prime.api.routes.enumerate import router as enumerate_router
-        from thalos_prime.api.routes.decode import router as decode_router
-        from thalos_prime.api.routes.admin import router as admin_router
-        from thalos_prime.api.routes.main import router as main_router
-        
-        # Register routers with prefixes
-        app.include_router(main_router, tags=["Main"])
-        app.include_router(chat_router, prefix="/api/v1/chat", tags=["Chat"])
-        app.include_router(search_router, prefix="/api/v1/search", tags=["Search"])
-        app.include_router(generate_router, prefix="/api/v1/generate", tags=["Generate"])
-        app.include_router(enumerate_router, prefix="/api/v1/enumerate", tags=["Enumerate"])
-        app.include_router(decode_router, prefix="/api/v1/decode", tags=["Decode"])
-        app.include_router(admin_router, prefix="/api/v1/admin", tags=["Admin"])
-        
-        logger.info("All routes registered successfully")
-    except ImportError as e:
-        logger.warning(f"Some routes could not be loaded: {e}")
-        # Create placeholder routes if imports fail
-        create_placeholder_routes(app)
-
-
-def create_placeholder_routes(app: FastAPI) -> None:
-    """Create placeholder routes when actual routes are not available"""
-    @app.get("/api/v1/status")
-    async def status() -> dict[str, str]:
-        return {"status": "ok", "message": "Thalos Prime API is running"}
+    # Register routers with prefixes
+    app.include_router(main_router, tags=["Main"])
+    app.include_router(chat_router, prefix="/api/v1/chat", tags=["Chat"])
+    app.include_router(search_router, prefix="/api/v1/search", tags=["Search"])
+    app.include_router(generate_router, prefix="/api/v1/generate", tags=["Generate"])
+    app.include_router(enumerate_router, prefix="/api/v1/enumerate", tags=["Enumerate"])
+    app.include_router(decode_router, prefix="/api/v1/decode", tags=["Decode"])
+    app.include_router(admin_router, prefix="/api/v1/admin", tags=["Admin"])
+    
+    logger.info("All routes registered successfully")
 
 
 # Create the application instance
@@ -269,13 +314,24 @@ app = create_app()
 
 
 if __name__ == "__main__":
+    import os
     import uvicorn
     
-    # Run the server
+    config = api_config.config
+    
+    # THALOS_DEV=true runs a single auto-reloading process
+    dev_mode = os.getenv("THALOS_DEV", "false").lower() == "true"
+    
+    # Run the server. uvicorn uses uvloop and httptools automatically when
+    # they are installed (the 'fast' extra). Chat sessions and caches are
+    # per-process, so THALOS_WORKERS > 1 needs sticky routing upstream.
     uvicorn.run(
         "thalos_prime.api.server:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
+        host=config.host,
+        port=config.port,
+        reload=dev_mode,
+        workers=1 if dev_mode else config.workers,
+        loop="auto",
+        http="auto",
         log_level="info"
     )
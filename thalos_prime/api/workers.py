@@ -0,0 +1,104 @@
+"""
+Worker Pools - Shared executors for CPU-bound work
+
+Page generation and scoring are pure Python and hold the GIL, so batch
+endpoints hand them to a process pool instead of worker threads.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional, Sequence, TypeVar
+import asyncio
+import os
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# Process pool shared by all routes; started by the app at startup
+_CPU_POOL: Optional[ProcessPoolExecutor] = None
+
+# Smallest slice sent to the process pool. A conservative floor so each
+# submit/pickle round trip carries a batch of pages; not tuned on
+# multi-core hardware, so revisit it with measurements from a real host.
+MIN_CHUNK_SIZE = 16
+
+
+def cpu_count() -> int:
+    """Return the number of worker processes to use"""
+    return os.cpu_count() or 1
+
+
+def get_cpu_pool() -> ProcessPoolExecutor:
+    """Return the shared process pool, creating it once (called at startup)"""
+    global _CPU_POOL
+    
+    if _CPU_POOL is None:
+        _CPU_POOL = ProcessPoolExecutor(max_workers=cpu_count())
+    
+    return _CPU_POOL
+
+
+def shutdown_cpu_pool() -> None:
+    """Shut down the shared process pool, if it was started"""
+    global _CPU_POOL
+    
+    pool, _CPU_POOL = _CPU_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def chunk_evenly(items: Sequence[T], chunks: int, min_size: int = 1) -> list[list[T]]:
+    """
+    Split items into at most `chunks` contiguous, near-equal slices.
+    
+    Submitting one slice per worker amortizes the pickling round trip
+    over many items instead of paying it per item.
+    
+    Args:
+        items: Items to split, order is preserved
+        chunks: Maximum number of slices
+        min_size: Minimum slice length; fewer slices are made if needed
+    
+    Returns:
+        Non-empty slices whose concatenation equals items
+    """
+    chunks = max(1, min(chunks, len(items) // max(1, min_size)))
+    size, extra = divmod(len(items), chunks)
+    
+    result = []
+    start = 0
+    for i in range(chunks):
+        end = start + size + (1 if i < extra else 0)
+        if end > start:
+            result.append(list(items[start:end]))
+        start = end
+    
+    return result
+
+
+async def map_chunks(func: Callable[..., R], items: Sequence[T], *args: Any) -> list[R]:
+    """
+    Run func(chunk, *args) over slices of items, in the process pool when it pays.
+    
+    Slices are at least MIN_CHUNK_SIZE long. A request that fits in one
+    slice, or one made before the pool was started, runs in-process on a
+    worker thread and skips the process round trip.
+    
+    Args:
+        func: Module-level (picklable) function taking a slice first
+        items: Items to split, order is preserved
+        *args: Extra arguments passed to every call
+    
+    Returns:
+        One func result per slice, in order
+    """
+    chunks = chunk_evenly(items, cpu_count(), MIN_CHUNK_SIZE)
+    pool = _CPU_POOL
+    
+    if pool is None or len(chunks) < 2:
+        return [await asyncio.to_thread(func, chunk, *args) for chunk in chunks]
+    
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(*[
+        loop.run_in_executor(pool, func, chunk, *args)
+        for chunk in chunks
+    ])
@@ -13,6 +13,30 @@ from typing import Optional
 # Set up logger for this module
 logger = logging.getLogger(__name__)
 
+# Resolved form of library paths already found on disk; only existing paths
+# are remembered so a library mounted after a failed check is still picked up
+_RESOLVED_PATHS: dict[str, str] = {}
+
+
+def _resolve_existing(path: str) -> Optional[str]:
+    """
+    Resolve a library path, or return None if it does not exist.
+    
+    Successful lookups are memoized, so repeated setup calls (e.g. one per
+    worker start) skip the stat and resolve system calls.
+    """
+    resolved = _RESOLVED_PATHS.get(path)
+    if resolved is not None:
+        return resolved
+    
+    lib_path = Path(path)
+    if not lib_path.exists():
+        return None
+    
+    resolved = str(lib_path.resolve())
+    _RESOLVED_PATHS[path] = resolved
+    return resolved
+
 
 class LibraryConfig:
     """Configuration class for managing library paths and imports"""
@@ -44,11 +68,10 @@ class LibraryConfig:
         if self._added_to_path:
             return True
         
-        # Convert to Path object for better path handling
-        lib_path = Path(self.local_library_path)
-        
-        # Check if path exists
-        if not lib_path.exists():
+        # Resolve the path, checking that it exists
+        lib_path_str = _resolve_existing(self.local_library_path)
+        if lib_path_str is None:
+            lib_path = Path(self.local_library_path)
             warnings.warn(
                 f"Local library path does not exist: {lib_path}\n"
                 f"You can set the THALOS_LIBRARY_PATH environment variable or "
@@ -60,7 +83,6 @@ class LibraryConfig:
             return False
         
         # Add to sys.path if not already present
-        lib_path_str = str(lib_path.resolve())
         if lib_path_str not in sys.path:
             sys.path.insert(0, lib_path_str)
             self._added_to_path = True
@@ -81,6 +103,10 @@ class LibraryConfig:
         Args:
             path: New path to the local library
         """
+        if path == self.local_library_path:
+            # Same library; keep the existing sys.path registration
+            return
+        
         self.local_library_path = path
         self._added_to_path = False
 
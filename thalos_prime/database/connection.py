@@ -52,6 +52,8 @@ class DatabaseManager:
             pool_size=config.db_pool_size,
             max_overflow=config.db_max_overflow,
             pool_pre_ping=True,  # Verify connections before using
+            pool_use_lifo=True,  # Reuse the most recently returned (warm) connection
+            pool_reset_on_return='rollback',
             echo=False  # Set to True for SQL logging
         )
         
@@ -7,7 +7,59 @@ to generate deterministic candidate addresses where matching text might be found
 """
 
 import hashlib
-from typing import Any, List, Dict, Set, Tuple
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Iterator, List, Dict, NamedTuple, Set, Tuple
+
+
+class _Candidate(NamedTuple):
+    """Lightweight candidate record; converted to a dict only when returned"""
+    address: str
+    ngram: str
+    score: float
+    depth: int
+
+
+@lru_cache(maxsize=4096)
+def _ngram_seed_hash(ngram: str) -> Any:
+    """
+    Return a SHA-256 state that has already absorbed "<ngram>:".
+    
+    The prefix is the same for every depth offset of an n-gram, so callers
+    copy this state and feed only the offset instead of rehashing it.
+    Never update the returned object in place.
+    
+    Args:
+        ngram: N-gram string
+    
+    Returns:
+        hashlib SHA-256 object
+    """
+    return hashlib.sha256(ngram.encode('utf-8') + b':')
+
+
+@lru_cache(maxsize=8192)
+def _seeded_address(ngram: str, offset: int) -> str:
+    """
+    Hash "<ngram>:<offset>" to a hex address.
+    
+    Cached because the same n-grams recur across queries.
+    
+    Args:
+        ngram: N-gram string
+        offset: Depth offset
+    
+    Returns:
+        Hexadecimal address string
+    """
+    # Deterministic seed "<ngram>:<offset>": resume from the shared
+    # "<ngram>:" state and add only the offset digits
+    seed_hash = _ngram_seed_hash(ngram).copy()
+    seed_hash.update(b'%d' % offset)
+    
+    # A SHA-256 hex digest is exactly 64 hex characters (256 bits),
+    # which provides enough entropy for unique addresses
+    return seed_hash.hexdigest()
 
 
 class BabelEnumerator:
@@ -60,7 +112,7 @@ class BabelEnumerator:
             ngrams = [query]
         
         # Generate candidate addresses from n-grams
-        candidates = []
+        candidates: List[_Candidate] = []
         seen_addresses = set()
         
         for ngram in ngrams[:10]:  # Limit to top 10 ngrams
@@ -70,16 +122,48 @@ class BabelEnumerator:
                 
                 if address not in seen_addresses:
                     seen_addresses.add(address)
-                    candidates.append({
-                        'address': address,
-                        'ngrams': [ngram],
-                        'score': self._score_address(ngram, query),
-                        'depth': depth_level
-                    })
+                    candidates.append(_Candidate(
+                        address,
+                        ngram,
+                        self._score_address(ngram, query),
+                        depth_level
+                    ))
+        
+        # Sort by score (highest first) and limit results; only the
+        # returned candidates are materialized as dicts
+        candidates.sort(key=attrgetter('score'), reverse=True)
+        return [
+            {
+                'address': candidate.address,
+                'ngrams': [candidate.ngram],
+                'score': candidate.score,
+                'depth': candidate.depth
+            }
+            for candidate in candidates[:max_results]
+        ]
+    
+    def _addresses_only(self, query: str) -> Set[str]:
+        """
+        Collect the depth-1 address set used by find_common_addresses.
+        
+        One address per n-gram, for the same top-10 n-grams that
+        enumerate_addresses draws from, without scoring or ranking.
+        
+        Args:
+            query: Search query string
         
-        # Sort by score (highest first) and limit results
-        candidates.sort(key=lambda x: float(x['score']), reverse=True)  # type: ignore[arg-type]
-        return candidates[:max_results]
+        Returns:
+            Set of hex addresses
+        """
+        query = query.lower().strip()
+        
+        if not query:
+            return set()
+        
+        ngrams = self._extract_ngrams(query) or [query]
+        
+        # Same top-10 limit as enumerate_addresses
+        return {self._ngram_to_address(ngram) for ngram in ngrams[:10]}
     
     def _extract_ngrams(self, text: str) -> List[str]:
         """
@@ -108,8 +192,17 @@ class BabelEnumerator:
                     if ngram.strip():  # Avoid whitespace-only ngrams
                         ngrams.add(ngram.strip())
         
-        # Convert to sorted list (longer ngrams first, then alphabetical)
-        ngram_list = sorted(ngrams, key=lambda x: (-len(x), x))
+        # Convert to sorted list (longer ngrams first, then alphabetical).
+        # Bucket by length so each bucket sorts with the plain string
+        # comparator instead of a Python key callback per element. Words
+        # can be longer than max_ngram_size, so buckets use the real length.
+        buckets: Dict[int, List[str]] = {}
+        for ngram in ngrams:
+            buckets.setdefault(len(ngram), []).append(ngram)
+        
+        ngram_list: List[str] = []
+        for size in sorted(buckets, reverse=True):
+            ngram_list.extend(sorted(buckets[size]))
         return ngram_list
     
     def _ngram_to_address(self, ngram: str, offset: int = 0) -> str:
@@ -123,13 +216,7 @@ class BabelEnumerator:
         Returns:
             Hexadecimal address string
         """
-        # Create deterministic seed from ngram and offset
-        seed = f"{ngram}:{offset}"
-        hash_digest = hashlib.sha256(seed.encode('utf-8')).hexdigest()
-        
-        # Return first 64 hex characters (256 bits)
-        # This provides enough entropy for unique addresses
-        return hash_digest[:64]
+        return _seeded_address(ngram, offset)
     
     def _score_address(self, ngram: str, query: str) -> float:
         """
@@ -176,17 +263,46 @@ class BabelEnumerator:
         Returns:
             List of (substring, address) tuples
         """
-        results = []
+        return list(self.iter_substrings(text, substring_length))
+    
+    def iter_substrings(
+        self,
+        text: str,
+        substring_length: int = 10
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Lazily yield substrings of a given length and their addresses.
+        
+        Same output as enumerate_substrings, but pairs are produced one at a
+        time so callers can stop early or count without holding them all.
+        
+        Args:
+            text: Text to extract substrings from
+            substring_length: Length of substrings to extract
+        
+        Yields:
+            (substring, address) tuples
+        """
         text = text.lower()
         
+        # Inlined _ngram_to_address(substring, offset=0) for the hot loop
+        sha256 = hashlib.sha256
+        suffix = b':0'
+        
+        # Natural text repeats windows often (especially short ones), so each
+        # distinct substring is hashed only once per call
+        addresses: Dict[str, str] = {}
+        
         # Extract all substrings of the specified length
         for i in range(len(text) - substring_length + 1):
             substring = text[i:i + substring_length]
-            if substring.strip():  # Skip whitespace-only
-                address = self._ngram_to_address(substring, offset=0)
-                results.append((substring, address))
-        
-        return results
+            address = addresses.get(substring)
+            if address is None:
+                if not substring.strip():  # Skip whitespace-only
+                    continue
+                address = sha256(substring.encode('utf-8') + suffix).hexdigest()
+                addresses[substring] = address
+            yield substring, address
     
     def find_common_addresses(
         self,
@@ -205,9 +321,10 @@ class BabelEnumerator:
         Returns:
             List of hex addresses
         """
-        # Get addresses for both queries
-        addresses1 = {item['address'] for item in self.enumerate_addresses(query1, max_results=50)}
-        addresses2 = {item['address'] for item in self.enumerate_addresses(query2, max_results=50)}
+        # Get addresses for both queries; only the address set is needed,
+        # so skip the scoring, dicts and sort of enumerate_addresses
+        addresses1 = self._addresses_only(query1)
+        addresses2 = self._addresses_only(query2)
         
         # Find intersection
         common = list(addresses1 & addresses2)
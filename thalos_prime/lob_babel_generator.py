@@ -10,7 +10,10 @@ The Library of Babel uses a deterministic algorithm where:
 """
 
 import hashlib
-from typing import Optional, Tuple
+import os
+import re
+import struct
+from typing import List, Optional, Sequence, Tuple
 
 
 class BabelGenerator:
@@ -32,10 +35,31 @@ class BabelGenerator:
     # For hexadecimal addresses
     HEX_CHARS = '0123456789abcdef'
     
+    # Encoded position suffixes appended to the seed, built once per process
+    _POSITION_SUFFIXES = tuple(str(position).encode('utf-8') for position in range(PAGE_LENGTH))
+    
+    # Byte table mapping every byte outside CHARSET to a space
+    _NON_CHARSET_BYTES = bytes(range(256)).translate(None, CHARSET.encode('ascii'))
+    _ASCII_NORMALIZE_TABLE = bytes.maketrans(_NON_CHARSET_BYTES, b' ' * len(_NON_CHARSET_BYTES))
+    
+    # Maps each CHARSET character to its index as a base-29 digit (0-9, a-s)
+    _BASE29_DIGITS = str.maketrans(CHARSET, '0123456789abcdefghijklmnopqrs')
+    
+    # Matches any character outside CHARSET, for arbitrary Unicode input
+    _NON_CHARSET_RE = re.compile('[^' + re.escape(CHARSET) + ']')
+    
+    # Byte table mapping a character index (0-28) to its CHARSET character
+    _INDEX_TO_CHAR_TABLE = bytes.maketrans(bytes(range(CHARSET_SIZE)), CHARSET.encode('ascii'))
+    
+    # Reads the leading big-endian uint32 of each of PAGE_LENGTH concatenated
+    # SHA-256 digests (32 bytes each) in one C-level call
+    _DIGEST_HEADS = struct.Struct('>' + 'I28x' * PAGE_LENGTH)
+    
     def __init__(self) -> None:
         """Initialize the Babel generator"""
         self._charset_map = {char: idx for idx, char in enumerate(self.CHARSET)}
         self._reverse_map = {idx: char for idx, char in enumerate(self.CHARSET)}
+        self._charset_set = frozenset(self.CHARSET)
     
     def address_to_page(self, hex_address: str) -> str:
         """
@@ -50,28 +74,52 @@ class BabelGenerator:
         Returns:
             A 3200-character page string
         """
-        # Normalize the hex address
-        hex_address = hex_address.lower().strip()
-        
-        # Use the hex address as a seed for deterministic generation
-        # We'll use SHA-256 to create a deterministic sequence
-        seed = hex_address.encode('utf-8')
-        
-        # Generate the page character by character
-        page_chars = []
-        for position in range(self.PAGE_LENGTH):
-            # Create a unique hash for each position using the seed and position
-            position_seed = seed + str(position).encode('utf-8')
-            hash_digest = hashlib.sha256(position_seed).digest()
+        return self.address_to_pages([hex_address])[0]
+    
+    def address_to_pages(self, hex_addresses: Sequence[str]) -> List[str]:
+        """
+        Generate pages for several addresses in one pass.
+        
+        Produces exactly the same pages as calling address_to_page on each
+        address, with the per-call setup (attribute and method lookups)
+        paid once for the whole batch.
+        
+        Args:
+            hex_addresses: Hexadecimal address strings
+        
+        Returns:
+            List of 3200-character page strings, in input order
+        """
+        sha256 = hashlib.sha256
+        position_suffixes = self._POSITION_SUFFIXES
+        unpack_heads = self._DIGEST_HEADS.unpack
+        index_to_char = self._INDEX_TO_CHAR_TABLE
+        charset_size = self.CHARSET_SIZE
+        
+        pages = []
+        for hex_address in hex_addresses:
+            # Normalize the hex address and use it as the seed. Hash the seed
+            # once and clone that state for every position; equivalent to
+            # sha256(seed + position) without rehashing the seed
+            seed_hash = sha256(hex_address.lower().strip().encode('utf-8'))
+            copy_seed_hash = seed_hash.copy
             
-            # Convert first 4 bytes to an integer
-            hash_int = int.from_bytes(hash_digest[:4], byteorder='big')
+            # Collect one digest per position; the loop only drives hashlib.
+            # Digests are unpacked page by page so the buffer stays small
+            digests = []
+            append_digest = digests.append
+            for position_suffix in position_suffixes:
+                position_hash = copy_seed_hash()
+                position_hash.update(position_suffix)
+                append_digest(position_hash.digest())
             
-            # Map to character index (0-28)
-            char_index = hash_int % self.CHARSET_SIZE
-            page_chars.append(self.CHARSET[char_index])
+            # Map the first 4 bytes of each digest to a character index (0-28),
+            # then turn the indices into characters with one C-level translate
+            hash_ints = unpack_heads(b''.join(digests))
+            indices = bytes([hash_int % charset_size for hash_int in hash_ints])
+            pages.append(indices.translate(index_to_char).decode('ascii'))
         
-        return ''.join(page_chars)
+        return pages
     
     def text_to_address(self, text: str) -> str:
         """
@@ -90,12 +138,9 @@ class BabelGenerator:
         # Normalize text (pad or truncate to 3200 chars)
         normalized = self._normalize_text(text)
         
-        # Convert to base-29 representation
-        address_value = 0
-        for i, char in enumerate(normalized):
-            if char in self._charset_map:
-                char_index = self._charset_map[char]
-                address_value = address_value * self.CHARSET_SIZE + char_index
+        # Convert to base-29 representation: rewrite each character as its
+        # base-29 digit and let int() parse the whole number in C
+        address_value = int(normalized.translate(self._BASE29_DIGITS), self.CHARSET_SIZE)
         
         # Convert to hexadecimal
         hex_address = hex(address_value)[2:]  # Remove '0x' prefix
@@ -119,21 +164,15 @@ class BabelGenerator:
         # Convert to lowercase
         text = text.lower()
         
-        # Replace unsupported characters with space
-        normalized_chars = []
-        for char in text:
-            if char in self._charset_map:
-                normalized_chars.append(char)
-            else:
-                normalized_chars.append(' ')
-        
-        normalized = ''.join(normalized_chars)
+        # Replace unsupported characters with space, in C: a byte table for
+        # the common ASCII case, a character class otherwise
+        if text.isascii():
+            normalized = text.encode('ascii').translate(self._ASCII_NORMALIZE_TABLE).decode('ascii')
+        else:
+            normalized = self._NON_CHARSET_RE.sub(' ', text)
         
         # Pad or truncate to PAGE_LENGTH
-        if len(normalized) < self.PAGE_LENGTH:
-            normalized = normalized + ' ' * (self.PAGE_LENGTH - len(normalized))
-        else:
-            normalized = normalized[:self.PAGE_LENGTH]
+        normalized = normalized[:self.PAGE_LENGTH].ljust(self.PAGE_LENGTH)
         
         return normalized
     
@@ -150,9 +189,14 @@ class BabelGenerator:
         if len(page) != self.PAGE_LENGTH:
             return False, f"Page length must be {self.PAGE_LENGTH}, got {len(page)}"
         
-        for i, char in enumerate(page):
-            if char not in self._charset_map:
-                return False, f"Invalid character '{char}' at position {i}"
+        # Fast path: a set comparison runs in C; only search when invalid
+        if self._charset_set.issuperset(page):
+            return True, ""
+        
+        # Locate the first invalid character with the compiled class, also in C
+        match = self._NON_CHARSET_RE.search(page)
+        if match is not None:
+            return False, f"Invalid character '{match.group()}' at position {match.start()}"
         
         return True, ""
     
@@ -167,8 +211,9 @@ class BabelGenerator:
             Hexadecimal address string
         """
         if seed is None:
-            import time
-            seed = str(time.time())
+            # Unseeded: take the address straight from the OS CSPRNG, the
+            # same length as a SHA-256 hex digest
+            return os.urandom(32).hex()
         
         # Generate a deterministic "random" address from seed
         hash_digest = hashlib.sha256(seed.encode('utf-8')).hexdigest()
@@ -192,6 +237,19 @@ def address_to_page(hex_address: str) -> str:
     return _generator.address_to_page(hex_address)
 
 
+def address_to_pages(hex_addresses: Sequence[str]) -> List[str]:
+    """
+    Convenience function to generate pages for several addresses.
+    
+    Args:
+        hex_addresses: Hexadecimal address strings
+    
+    Returns:
+        List of 3200-character page strings
+    """
+    return _generator.address_to_pages(hex_addresses)
+
+
 def text_to_address(text: str) -> str:
     """
     Convenience function to find the address of text.
@@ -6,14 +6,16 @@ readability of generated pages, with optional LLM-based normalization.
 """
 
 import re
-from typing import Any, Dict, List, Tuple, Optional
-from dataclasses import dataclass
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Tuple, Optional
+from dataclasses import dataclass, replace
+from functools import lru_cache
 import time
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CoherenceScore:
-    """Result of coherence analysis"""
+    """Result of coherence analysis (immutable; cached copies are never handed out)"""
     overall_score: float  # 0-100 scale
     language_score: float  # English word density
     structure_score: float  # Punctuation and sentence structure
@@ -23,7 +25,7 @@ class CoherenceScore:
     metrics: Dict[str, Any]  # Detailed metrics
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DecodedPage:
     """A decoded page with scores and metadata"""
     address: str
@@ -35,6 +37,57 @@ class DecodedPage:
     provenance: Dict[str, Any]
 
 
+# Every byte except the punctuation marks counted by the structure scores;
+# deleting these with bytes.translate leaves only the marks
+_NON_PUNCTUATION_BYTES = bytes(range(256)).translate(None, b'.,!?')
+
+
+class _TextScan(NamedTuple):
+    """Per-text values shared by the scoring helpers, computed once"""
+    lower: str  # text.lower()
+    words: List[str]  # lower.split()
+    unique_words: FrozenSet[str]  # distinct words, shared by diversity and query matching
+    common_mask: bytes  # one byte per word: 1 if in COMMON_WORDS, else 0
+    period_count: int
+    comma_count: int
+    exclaim_count: int
+    question_count: int
+    has_breaks: bool  # newline or double space present
+
+
+# Longest query whose terms are memoized (the search/enumerate query limit);
+# /decode/ queries are unbounded and must not be pinned in the cache
+QUERY_CACHE_MAX_LENGTH = 1000
+
+
+def _split_query(query: str) -> Tuple[str, FrozenSet[str]]:
+    """Lowercase a query and split it into distinct words"""
+    query_lower = query.lower()
+    return query_lower, frozenset(query_lower.split())
+
+
+_cached_query_terms = lru_cache(maxsize=1024)(_split_query)
+
+
+def _query_terms(query: str) -> Tuple[str, FrozenSet[str]]:
+    """
+    Lowercase a query and split it into distinct words.
+    
+    A search scores many pages against one query, so this is done once
+    per query rather than once per page. Over-long queries are split on
+    every call instead of being cached.
+    
+    Args:
+        query: Query string
+    
+    Returns:
+        Tuple of (lowercased query, set of its words)
+    """
+    if len(query) > QUERY_CACHE_MAX_LENGTH:
+        return _split_query(query)
+    return _cached_query_terms(query)
+
+
 class BabelDecoder:
     """
     Enhanced decoder with multi-metric coherence scoring.
@@ -44,10 +97,15 @@ class BabelDecoder:
     - Structure analysis (punctuation, capitalization)
     - N-gram coherence (bigram/trigram probabilities)
     - Exact match detection (query matching)
+    
+    Scoring is safe to call from many threads at once without a lock:
+    weights and lookup tables are never modified after construction, and
+    the score cache only uses single OrderedDict operations (atomic under
+    the GIL) and tolerates entries vanishing between them.
     """
     
     # Common English words for language detection
-    COMMON_WORDS = {
+    COMMON_WORDS = frozenset({
         'the', 'be', 'to', 'of', 'and', 'a', 'in', 'that', 'have', 'i',
         'it', 'for', 'not', 'on', 'with', 'he', 'as', 'you', 'do', 'at',
         'this', 'but', 'his', 'by', 'from', 'they', 'we', 'say', 'her', 'she',
@@ -58,7 +116,13 @@ class BabelDecoder:
         'than', 'then', 'now', 'look', 'only', 'come', 'its', 'over', 'think', 'also',
         'back', 'after', 'use', 'two', 'how', 'our', 'work', 'first', 'well', 'way',
         'even', 'new', 'want', 'because', 'any', 'these', 'give', 'day', 'most', 'us'
-    }
+    })
+    
+    # Scored (text, query) pairs kept per decoder; re-requested pages are
+    # common. Only texts and queries up to one page long are cached, so
+    # user-supplied input of any size cannot be pinned in memory.
+    SCORE_CACHE_SIZE = 1024
+    CACHEABLE_TEXT_LENGTH = 3200  # BabelGenerator.PAGE_LENGTH
     
     def __init__(
         self,
@@ -85,11 +149,18 @@ class BabelDecoder:
         
         self.llm_enabled = False
         self.llm_provider: Optional[str] = None
+        
+        # LRU of computed scores; weights are fixed per instance, so
+        # entries never go stale
+        self._score_cache: OrderedDict[Tuple[str, Optional[str]], CoherenceScore] = OrderedDict()
     
     def score_coherence(self, text: str, query: Optional[str] = None) -> CoherenceScore:
         """
         Score the coherence of a text using multiple heuristics.
         
+        Results are cached per (text, query) for page-sized inputs. Each
+        call gets its own metrics dict, so callers may modify it freely.
+        
         Args:
             text: Text to analyze (typically 3200 characters)
             query: Optional query string for match scoring
@@ -97,11 +168,57 @@ class BabelDecoder:
         Returns:
             CoherenceScore with detailed metrics
         """
+        cache = self._score_cache
+        key = (text, query)
+        
+        score = cache.get(key)
+        if score is not None:
+            # Entries can be evicted by another thread between these calls
+            try:
+                cache.move_to_end(key)
+            except KeyError:
+                pass
+            return replace(score, metrics=dict(score.metrics))
+        
+        score = self._compute_coherence(text, query)
+        
+        limit = self.CACHEABLE_TEXT_LENGTH
+        if len(text) <= limit and (query is None or len(query) <= limit):
+            # Cache a private copy; the caller owns the returned metrics
+            cache[key] = replace(score, metrics=dict(score.metrics))
+            
+            while len(cache) > self.SCORE_CACHE_SIZE:
+                try:
+                    cache.popitem(last=False)
+                except KeyError:
+                    break
+        
+        return score
+    
+    def clear_score_cache(self) -> None:
+        """Drop all cached coherence scores"""
+        self._score_cache.clear()
+    
+    def _compute_coherence(self, text: str, query: Optional[str]) -> CoherenceScore:
+        """
+        Score a text without consulting the cache.
+        
+        Args:
+            text: Text to analyze
+            query: Optional query string for match scoring
+        
+        Returns:
+            CoherenceScore with detailed metrics
+        """
+        # Derive the lowercased text, words and punctuation counts once and
+        # share them, instead of each helper re-scanning the text
+        scan = self._scan(text)
+        
         # Calculate individual scores
-        language_score = self._score_language(text)
-        structure_score = self._score_structure(text)
-        ngram_score = self._score_ngrams(text)
-        exact_match_score = self._score_exact_match(text, query) if query else 0.0
+        language_score = self._score_language(text, scan)
+        structure_score = self._score_structure(text, scan)
+        ngram_score = self._score_ngrams(text, scan)
+        exact_match_score = self._score_exact_match(text, query, scan) if query else 0.0
         
         # Calculate weighted overall score (0-100 scale)
         overall = (
@@ -128,8 +245,8 @@ class BabelDecoder:
             'ngram_score': ngram_score,
             'exact_match_score': exact_match_score,
             'text_length': len(text),
-            'word_count': len(text.split()),
-            'sentence_count': self._count_sentences(text)
+            'word_count': len(scan.words),
+            'sentence_count': self._count_sentences(text, scan)
         }
         
         return CoherenceScore(
@@ -142,45 +259,86 @@ class BabelDecoder:
             metrics=metrics
         )
     
-    def _score_language(self, text: str) -> float:
+    def _scan(self, text: str) -> _TextScan:
+        """
+        Compute everything the scoring helpers read from a text.
+        
+        Each value comes from one C-level pass (lower, split, count), and
+        every helper reuses them rather than repeating those passes.
+        
+        Args:
+            text: Text to analyze
+        
+        Returns:
+            _TextScan for the text
+        """
+        lower = text.lower()
+        words = lower.split()
+        
+        # Look each word up in COMMON_WORDS once, into a byte mask; both the
+        # language and bigram scores count over it with bytes.count
+        common_mask = bytes(map(self.COMMON_WORDS.__contains__, words))
+        
+        # Reduce the text to its punctuation bytes with one table-driven
+        # translate, then count each mark in that short buffer. Non-ASCII
+        # characters are never punctuation here, so they are dropped
+        punctuation = text.encode('ascii', 'ignore').translate(None, _NON_PUNCTUATION_BYTES)
+        
+        return _TextScan(
+            lower=lower,
+            words=words,
+            unique_words=frozenset(words),
+            common_mask=common_mask,
+            period_count=punctuation.count(b'.'),
+            comma_count=punctuation.count(b','),
+            exclaim_count=punctuation.count(b'!'),
+            question_count=punctuation.count(b'?'),
+            has_breaks='\n' in text or '  ' in text
+        )
+    
+    def _score_language(self, text: str, scan: Optional[_TextScan] = None) -> float:
         """
         Score based on English word density.
         
         Args:
             text: Text to analyze
+            scan: Precomputed scan of text (computed if omitted)
         
         Returns:
             Score between 0.0 and 1.0
         """
-        words = text.lower().split()
+        scan = scan or self._scan(text)
+        words = scan.words
         if not words:
             return 0.0
         
         # Count common English words
-        common_word_count = sum(1 for word in words if word in self.COMMON_WORDS)
+        common_word_count = len(words) - scan.common_mask.count(0)
         density = common_word_count / len(words)
         
         # Bonus for having some less common words (not all noise)
-        unique_words = len(set(words))
+        unique_words = len(scan.unique_words)
         diversity_bonus = min(0.1, unique_words / len(words) * 0.1)
         
         return min(1.0, density + diversity_bonus)
     
-    def _score_structure(self, text: str) -> float:
+    def _score_structure(self, text: str, scan: Optional[_TextScan] = None) -> float:
         """
         Score based on punctuation and sentence structure.
         
         Args:
             text: Text to analyze
+            scan: Precomputed scan of text (computed if omitted)
         
         Returns:
             Score between 0.0 and 1.0
         """
+        scan = scan or self._scan(text)
         score = 0.0
         
         # Check for punctuation (periods, commas, question marks, etc.)
-        period_count = text.count('.')
-        comma_count = text.count(',')
+        period_count = scan.period_count
+        comma_count = scan.comma_count
         
         # Presence of periods suggests sentence structure
         if period_count > 0:
@@ -193,33 +351,37 @@ class BabelDecoder:
         
         # Check for capital letters (sentence starts)
         # In Library of Babel, we mostly have lowercase, but structure matters
-        sentences = text.split('.')
-        if len(sentences) > 1:
+        # Splitting on '.' yields period_count + 1 pieces; only that count
+        # is needed, so the split itself is skipped
+        sentence_count = period_count + 1
+        if sentence_count > 1:
             # Multiple sentences present
             score += 0.2
             
             # Reasonable sentence length
-            avg_sentence_len = len(text) / len(sentences)
+            avg_sentence_len = len(text) / sentence_count
             if 20 <= avg_sentence_len <= 200:
                 score += 0.2
         
         # Bonus for paragraph-like structure
-        if '\n' in text or '  ' in text:
+        if scan.has_breaks:
             score += 0.1
         
         return min(1.0, score)
     
-    def _score_ngrams(self, text: str) -> float:
+    def _score_ngrams(self, text: str, scan: Optional[_TextScan] = None) -> float:
         """
         Score based on n-gram coherence (bigram/trigram patterns).
         
         Args:
             text: Text to analyze
+            scan: Precomputed scan of text (computed if omitted)
         
         Returns:
             Score between 0.0 and 1.0
         """
-        words = text.lower().split()
+        scan = scan or self._scan(text)
+        words = scan.words
         if len(words) < 2:
             return 0.0
         
@@ -227,20 +389,21 @@ class BabelDecoder:
         # Real implementation would use language model probabilities
         score = 0.0
         
-        # Count reasonable bigrams (both words are common)
-        coherent_bigrams = 0
-        for i in range(len(words) - 1):
-            if words[i] in self.COMMON_WORDS or words[i + 1] in self.COMMON_WORDS:
-                coherent_bigrams += 1
+        # Count reasonable bigrams (either word is common). A run of k
+        # uncommon words holds k - 1 incoherent bigrams, so the incoherent
+        # total is (uncommon words) - (runs of uncommon words); a run starts
+        # at the first word or right after a common one (b'\x01\x00')
+        mask = scan.common_mask
+        uncommon = mask.count(0)
+        uncommon_runs = mask.count(b'\x01\x00') + (mask[0] == 0)
+        coherent_bigrams = (len(words) - 1) - (uncommon - uncommon_runs)
         
         bigram_ratio = coherent_bigrams / max(1, len(words) - 1)
         score += bigram_ratio * 0.6
         
-        # Check for repeated patterns (sign of structure)
-        unique_bigrams = set()
-        for i in range(len(words) - 1):
-            bigram = (words[i], words[i + 1])
-            unique_bigrams.add(bigram)
+        # Check for repeated patterns (sign of structure); zip pairs each
+        # word with the next and the set is built without a Python loop
+        unique_bigrams = set(zip(words, words[1:]))
         
         # Some repetition is good, too much is bad
         repetition_ratio = len(unique_bigrams) / max(1, len(words) - 1)
@@ -249,13 +412,14 @@ class BabelDecoder:
         
         return min(1.0, score)
     
-    def _score_exact_match(self, text: str, query: str) -> float:
+    def _score_exact_match(self, text: str, query: str, scan: Optional[_TextScan] = None) -> float:
         """
         Score based on exact or fuzzy query matching.
         
         Args:
             text: Text to analyze
             query: Query string to match
+            scan: Precomputed scan of text (computed if omitted)
         
         Returns:
             Score between 0.0 and 1.0
@@ -263,16 +427,15 @@ class BabelDecoder:
         if not query:
             return 0.0
         
-        text_lower = text.lower()
-        query_lower = query.lower()
+        scan = scan or self._scan(text)
+        query_lower, query_words = _query_terms(query)
         
         # Exact match gets highest score
-        if query_lower in text_lower:
+        if query_lower in scan.lower:
             return 1.0
         
         # Check for word-level matches
-        query_words = set(query_lower.split())
-        text_words = set(text_lower.split())
+        text_words = scan.unique_words
         
         matching_words = query_words & text_words
         if query_words:
@@ -281,9 +444,10 @@ class BabelDecoder:
         
         return 0.0
     
-    def _count_sentences(self, text: str) -> int:
+    def _count_sentences(self, text: str, scan: Optional[_TextScan] = None) -> int:
         """Count approximate number of sentences."""
-        return max(1, text.count('.') + text.count('!') + text.count('?'))
+        scan = scan or self._scan(text)
+        return max(1, scan.period_count + scan.exclaim_count + scan.question_count)
     
     def decode_page(
         self,
@@ -314,13 +478,16 @@ class BabelDecoder:
         if normalize and self.llm_enabled:
             normalized_text = self._normalize_with_llm(text, query)
         
+        # One clock read shared by the provenance record and the page
+        timestamp = time.time()
+        
         # Create provenance record
         provenance = {
             'address': address,
             'source': source,
             'query': query,
             'normalized': normalize and self.llm_enabled,
-            'timestamp': time.time()
+            'timestamp': timestamp
         }
         
         return DecodedPage(
@@ -329,10 +496,44 @@ class BabelDecoder:
             normalized_text=normalized_text,
             coherence=coherence,
             source=source,
-            timestamp=time.time(),
+            timestamp=timestamp,
             provenance=provenance
         )
     
+    def decode_pages(
+        self,
+        addresses: List[str],
+        texts: List[str],
+        query: Optional[str] = None,
+        source: str = 'local'
+    ) -> List[DecodedPage]:
+        """
+        Decode a batch of pages that share the same query and source.
+        
+        Args:
+            addresses: Hex addresses of the pages
+            texts: Page texts, aligned with addresses
+            query: Optional query for relevance scoring
+            source: 'local' or 'remote'
+        
+        Returns:
+            List of DecodedPage in input order
+        
+        Raises:
+            ValueError: If addresses and texts differ in length
+        """
+        if len(addresses) != len(texts):
+            raise ValueError(
+                f"addresses and texts must have the same length, "
+                f"got {len(addresses)} and {len(texts)}"
+            )
+        
+        decode = self.decode_page
+        return [
+            decode(address, text, query, source)
+            for address, text in zip(addresses, texts)
+        ]
+    
     def _normalize_with_llm(self, text: str, query: Optional[str] = None) -> str:
         """
         Normalize text using LLM (placeholder for future implementation).
@@ -379,6 +580,11 @@ def score_coherence(text: str, query: Optional[str] = None) -> CoherenceScore:
     return _decoder.score_coherence(text, query)
 
 
+def clear_score_cache() -> None:
+    """Drop the global decoder's cached coherence scores"""
+    _decoder.clear_score_cache()
+
+
 def decode_page(
     address: str,
     text: str,
@@ -398,3 +604,24 @@ def decode_page(
         DecodedPage
     """
     return _decoder.decode_page(address, text, query, source)
+
+
+def decode_pages(
+    addresses: List[str],
+    texts: List[str],
+    query: Optional[str] = None,
+    source: str = 'local'
+) -> List[DecodedPage]:
+    """
+    Convenience function to decode a batch of pages.
+    
+    Args:
+        addresses: Hex addresses
+        texts: Page texts, aligned with addresses
+        query: Optional query
+        source: 'local' or 'remote'
+    
+    Returns:
+        List of DecodedPage
+    """
+    return _decoder.decode_pages(addresses, texts, query, source)
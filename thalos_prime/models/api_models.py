@@ -5,8 +5,8 @@ These models define the schema for all API endpoints.
 """
 
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, validator
+from datetime import datetime, timezone
 from enum import Enum
 
 
@@ -42,8 +42,8 @@ class AddressInfo(BaseModel):
     page: Optional[int] = Field(None, description="Page number")
     url: Optional[str] = Field(None, description="Full URL to page")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "hex_address": "abc123def456",
                 "wall": 1,
@@ -53,6 +53,7 @@ class AddressInfo(BaseModel):
                 "url": "https://libraryofbabel.info/book.cgi?hex=abc123def456"
             }
         }
+    )
 
 
 # Coherence Information
@@ -66,8 +67,8 @@ class CoherenceInfo(BaseModel):
     confidence_level: ConfidenceLevel = Field(..., description="Confidence level")
     metrics: Dict[str, Any] = Field(default_factory=dict, description="Additional metrics")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "overall_score": 75.5,
                 "language_score": 65.0,
@@ -78,6 +79,7 @@ class CoherenceInfo(BaseModel):
                 "metrics": {"word_count": 150, "sentence_count": 8}
             }
         }
+    )
 
 
 # Provenance Information
@@ -90,8 +92,8 @@ class ProvenanceInfo(BaseModel):
     normalized: bool = Field(default=False, description="Whether normalization was applied")
     llm_provider: Optional[str] = Field(None, description="LLM provider if used")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "address": "abc123",
                 "source": "local",
@@ -101,6 +103,7 @@ class ProvenanceInfo(BaseModel):
                 "llm_provider": None
             }
         }
+    )
 
 
 # Page Result
@@ -113,8 +116,46 @@ class PageResult(BaseModel):
     provenance: ProvenanceInfo = Field(..., description="Provenance information")
     normalized_text: Optional[str] = Field(None, description="Normalized text if available")
     
-    class Config:
-        json_schema_extra = {
+    @classmethod
+    def build_trusted(
+        cls,
+        *,
+        address: Dict[str, Any],
+        text: str,
+        snippet: Optional[str],
+        coherence: Dict[str, Any],
+        provenance: Dict[str, Any],
+        normalized_text: Optional[str] = None
+    ) -> "PageResult":
+        """
+        Assemble a PageResult from already-validated data without validation.
+        
+        For internal pipelines whose output is trusted (e.g. decoder results).
+        Sub-model dicts must supply every field, since model_construct does
+        not check for missing ones.
+        
+        Args:
+            address: AddressInfo fields
+            text: Page text
+            snippet: Short snippet preview
+            coherence: CoherenceInfo fields
+            provenance: ProvenanceInfo fields
+            normalized_text: Normalized text if available
+        
+        Returns:
+            PageResult built with model_construct
+        """
+        return cls.model_construct(
+            address=AddressInfo.model_construct(**address),
+            text=text,
+            snippet=snippet,
+            coherence=CoherenceInfo.model_construct(**coherence),
+            provenance=ProvenanceInfo.model_construct(**provenance),
+            normalized_text=normalized_text
+        )
+    
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "address": {"hex_address": "abc123", "url": "https://libraryofbabel.info/book.cgi?hex=abc123"},
                 "text": "the quick brown fox...",
@@ -123,6 +164,7 @@ class PageResult(BaseModel):
                 "provenance": {"address": "abc123", "source": "local", "timestamp": 1707768000.0}
             }
         }
+    )
 
 
 # Chat Endpoint Models
@@ -133,14 +175,12 @@ class ChatRequest(BaseModel):
     max_results: int = Field(default=5, ge=1, le=20, description="Maximum results to return")
     mode: SearchMode = Field(default=SearchMode.HYBRID, description="Search mode")
     
-    @validator('message')
-    def message_not_empty(cls, v: str) -> str:
-        if not v.strip():
-            raise ValueError('Message cannot be empty or whitespace only')
-        return v.strip()
-    
-    class Config:
-        json_schema_extra = {
+    # Whitespace stripping and the min_length check run in pydantic-core;
+    # requests are never mutated after validation
+    model_config = ConfigDict(
+        str_strip_whitespace=True,
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "message": "hello world",
                 "session_id": "550e8400-e29b-41d4-a716-446655440000",
@@ -148,6 +188,7 @@ class ChatRequest(BaseModel):
                 "mode": "hybrid"
             }
         }
+    )
 
 
 class ChatResponse(BaseModel):
@@ -157,8 +198,8 @@ class ChatResponse(BaseModel):
     results: List[PageResult] = Field(default_factory=list, description="Search results")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "reply": "Found 5 results for your query...",
                 "session_id": "550e8400-e29b-41d4-a716-446655440000",
@@ -166,6 +207,7 @@ class ChatResponse(BaseModel):
                 "metadata": {"query_time_ms": 150}
             }
         }
+    )
 
 
 # Search Endpoint Models
@@ -176,14 +218,10 @@ class SearchRequest(BaseModel):
     mode: SearchMode = Field(default=SearchMode.HYBRID, description="Search mode")
     min_score: float = Field(default=0.0, ge=0, le=100, description="Minimum coherence score")
     
-    @validator('query')
-    def query_not_empty(cls, v: str) -> str:
-        if not v.strip():
-            raise ValueError('Query cannot be empty or whitespace only')
-        return v.strip()
-    
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        str_strip_whitespace=True,
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "query": "the meaning of life",
                 "max_results": 10,
@@ -191,6 +229,7 @@ class SearchRequest(BaseModel):
                 "min_score": 40.0
             }
         }
+    )
 
 
 class SearchResponse(BaseModel):
@@ -202,8 +241,8 @@ class SearchResponse(BaseModel):
     cached: bool = Field(default=False, description="Whether results were cached")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "query": "test query",
                 "results": [],
@@ -213,6 +252,7 @@ class SearchResponse(BaseModel):
                 "metadata": {"search_time_ms": 250}
             }
         }
+    )
 
 
 # Generate Endpoint Models
@@ -228,13 +268,14 @@ class GenerateRequest(BaseModel):
             raise ValueError('Either address or query must be provided')
         return v
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "address": "abc123def456",
                 "validate": True
             }
         }
+    )
 
 
 class GenerateResponse(BaseModel):
@@ -244,8 +285,8 @@ class GenerateResponse(BaseModel):
     valid: bool = Field(..., description="Whether page passed validation")
     generation_time_ms: float = Field(..., description="Generation time in milliseconds")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "address": {"hex_address": "abc123", "url": "https://libraryofbabel.info/book.cgi?hex=abc123"},
                 "text": "generated page text...",
@@ -253,6 +294,7 @@ class GenerateResponse(BaseModel):
                 "generation_time_ms": 0.5
             }
         }
+    )
 
 
 # Enumerate Endpoint Models
@@ -262,20 +304,17 @@ class EnumerateRequest(BaseModel):
     max_results: int = Field(default=10, ge=1, le=100, description="Maximum addresses")
     depth: int = Field(default=1, ge=1, le=10, description="Enumeration depth")
     
-    @validator('query')
-    def query_not_empty(cls, v: str) -> str:
-        if not v.strip():
-            raise ValueError('Query cannot be empty or whitespace only')
-        return v.strip()
-    
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        str_strip_whitespace=True,
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "query": "hello world",
                 "max_results": 10,
                 "depth": 2
             }
         }
+    )
 
 
 class EnumerateResponse(BaseModel):
@@ -285,8 +324,8 @@ class EnumerateResponse(BaseModel):
     total_found: int = Field(..., description="Total addresses found")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "query": "hello world",
                 "addresses": [
@@ -296,6 +335,7 @@ class EnumerateResponse(BaseModel):
                 "metadata": {"enumeration_time_ms": 5.0}
             }
         }
+    )
 
 
 # Decode Endpoint Models
@@ -306,8 +346,8 @@ class DecodeRequest(BaseModel):
     query: Optional[str] = Field(None, description="Query for relevance scoring")
     normalization: NormalizationMode = Field(default=NormalizationMode.HEURISTIC, description="Normalization mode")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "address": "abc123",
                 "text": "page text to analyze...",
@@ -315,6 +355,7 @@ class DecodeRequest(BaseModel):
                 "normalization": "heuristic"
             }
         }
+    )
 
 
 class DecodeResponse(BaseModel):
@@ -325,8 +366,8 @@ class DecodeResponse(BaseModel):
     coherence: CoherenceInfo = Field(..., description="Coherence analysis")
     provenance: ProvenanceInfo = Field(..., description="Provenance information")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "address": {"hex_address": "abc123"},
                 "raw_text": "original text...",
@@ -335,6 +376,7 @@ class DecodeResponse(BaseModel):
                 "provenance": {"address": "abc123", "source": "local", "timestamp": 1707768000.0}
             }
         }
+    )
 
 
 # Status and Error Models
@@ -345,8 +387,8 @@ class StatusResponse(BaseModel):
     uptime_seconds: float = Field(..., description="Service uptime in seconds")
     features: Dict[str, bool] = Field(default_factory=dict, description="Available features")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "healthy",
                 "version": "1.0.0",
@@ -354,6 +396,7 @@ class StatusResponse(BaseModel):
                 "features": {"local_generation": True, "remote_search": True, "llm_normalization": False}
             }
         }
+    )
 
 
 class ErrorResponse(BaseModel):
@@ -361,10 +404,10 @@ class ErrorResponse(BaseModel):
     error: str = Field(..., description="Error type")
     message: str = Field(..., description="Error message")
     details: Optional[Dict[str, Any]] = Field(None, description="Additional error details")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Error timestamp")
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Error timestamp")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "error": "ValidationError",
                 "message": "Invalid request parameters",
@@ -372,3 +415,9 @@ class ErrorResponse(BaseModel):
                 "timestamp": "2026-02-12T20:00:00Z"
             }
         }
+    )
+
+
+# Built once at import; reused on hot paths instead of rebuilding the
+# list-of-model schema per call
+PAGE_RESULT_LIST_ADAPTER = TypeAdapter(List[PageResult])